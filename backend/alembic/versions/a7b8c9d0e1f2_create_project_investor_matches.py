@@ -0,0 +1,52 @@
+"""create project investor matches
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-02-09 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_investor_matches",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("investor_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("score_100", sa.Integer(), nullable=False),
+        sa.Column("country_match", sa.Boolean(), nullable=False),
+        sa.Column("score_breakdown", sa.JSON(), nullable=False),
+        sa.Column("reasons", sa.JSON(), nullable=False),
+        sa.Column("reason_points", sa.JSON(), nullable=False),
+        sa.Column("why", sa.Text(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["investor_id"], ["investors.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "investor_id"),
+    )
+    op.create_index(
+        "ix_project_investor_matches_rank",
+        "project_investor_matches",
+        ["project_id", sa.text("score_100 DESC"), sa.text("investor_id DESC")],
+    )
+    op.create_index(
+        "ix_project_investor_matches_investor_id",
+        "project_investor_matches",
+        ["investor_id"],
+    )
+    # Rows are filled lazily on first read, or all at once with
+    # `python -m scripts.precompute_matches --write`
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_investor_matches_investor_id", table_name="project_investor_matches")
+    op.drop_index("ix_project_investor_matches_rank", table_name="project_investor_matches")
+    op.drop_table("project_investor_matches")
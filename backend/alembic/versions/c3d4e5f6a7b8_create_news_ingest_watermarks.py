@@ -0,0 +1,29 @@
+"""create news ingest watermarks
+
+Revision ID: c3d4e5f6a7b8
+Revises: add_institutions_targets
+Create Date: 2026-01-12 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c3d4e5f6a7b8"
+down_revision = "add_institutions_targets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "news_ingest_watermarks",
+        sa.Column("scope", sa.String(length=10), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("news_ingest_watermarks")
@@ -0,0 +1,35 @@
+"""store positive matches only
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-03-02 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c9d0e1f2a3b4"
+down_revision = "b8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("matches_computed_at", sa.DateTime(timezone=True), nullable=True))
+    # Projects with stored rows have been computed; the rest fill on first read
+    op.execute(
+        "UPDATE projects SET matches_computed_at = now() "
+        "WHERE id IN (SELECT DISTINCT project_id FROM project_investor_matches)"
+    )
+    # Zero-score pairs are no longer stored (they are filled in at read time)
+    op.execute("DELETE FROM project_investor_matches WHERE score_100 = 0")
+
+
+def downgrade() -> None:
+    # Projects missing their zero-score rows are recomputed on first read
+    op.execute(
+        "DELETE FROM project_investor_matches WHERE project_id IN "
+        "(SELECT id FROM projects WHERE matches_computed_at IS NOT NULL)"
+    )
+    op.drop_column("projects", "matches_computed_at")
@@ -0,0 +1,56 @@
+"""add news feed indexes
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-01-19 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "d4e5f6a7b8c9"
+down_revision = "c3d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # list_news / search: WHERE status='approved' ORDER BY published_at DESC, id DESC
+    op.create_index(
+        "ix_news_items_approved_published",
+        "news_items",
+        [sa.text("published_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("status = 'approved'"),
+    )
+    # list_news?country_id=: WHERE status='approved' AND country_id=? ORDER BY ...
+    op.create_index(
+        "ix_news_items_approved_country_published",
+        "news_items",
+        ["country_id", sa.text("published_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("status = 'approved'"),
+    )
+    # list_pending_news: WHERE status='pending' ORDER BY published_at DESC LIMIT 50
+    op.create_index(
+        "ix_news_items_pending_published",
+        "news_items",
+        [sa.text("published_at DESC")],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    # The low-selectivity status index is covered by the partial indexes above
+    op.drop_index("ix_news_items_status", table_name="news_items")
+
+    # list_resources / list_pending / search: WHERE status=? ORDER BY submitted_at DESC
+    op.create_index(
+        "ix_resources_status_submitted",
+        "resources",
+        ["status", sa.text("submitted_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resources_status_submitted", table_name="resources")
+    op.create_index("ix_news_items_status", "news_items", ["status"])
+    op.drop_index("ix_news_items_pending_published", table_name="news_items")
+    op.drop_index("ix_news_items_approved_country_published", table_name="news_items")
+    op.drop_index("ix_news_items_approved_published", table_name="news_items")
@@ -0,0 +1,41 @@
+"""add full-text search vectors
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-01-26 10:00:00.000000
+
+"""
+
+from alembic import op
+
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+# table -> (title column weighted A, body column weighted B)
+SEARCHABLE = {
+    "news_items": ("title", "summary"),
+    "resources": ("title", "abstract"),
+    "country_policies": ("title", "summary"),
+    "country_frameworks": ("name", "description"),
+}
+
+
+def upgrade() -> None:
+    for table, (title, body) in SEARCHABLE.items():
+        op.execute(f"""
+            ALTER TABLE {table} ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce({title}, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce({body}, '')), 'B')
+            ) STORED
+        """)
+        op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    for table in SEARCHABLE:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
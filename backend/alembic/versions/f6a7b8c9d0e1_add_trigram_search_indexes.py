@@ -0,0 +1,48 @@
+"""add trigram search indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-02-02 10:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy.exc import DBAPIError
+
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+# Columns searched with ILIKE / word_similarity by the directory listings
+TRIGRAM_COLUMNS = {
+    "projects": ["title", "summary"],
+    "investors": ["name", "focus_sectors", "stages"],
+    "resources": ["title", "abstract"],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    try:
+        with bind.begin_nested():
+            bind.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DBAPIError:
+        # Managed databases may not allow extensions; the app then keeps
+        # plain ILIKE search and these indexes are simply not created.
+        print("pg_trgm is not available; skipping trigram indexes")
+        return
+
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm")
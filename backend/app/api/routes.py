@@ -6,6 +6,8 @@ from app.api.v1.investors import router as investors_router
 from app.api.v1.news import router as news_router
 from app.api.v1.library import router as library_router
 from app.api.v1.search import router as search_router
+from app.api.v1.metrics import router as metrics_router
+from app.api.v1.export import router as export_router
 
 router = APIRouter()
 
@@ -15,3 +17,5 @@ router.include_router(investors_router, prefix="/v1")
 router.include_router(news_router, prefix="/v1")
 router.include_router(library_router, prefix="/v1")
 router.include_router(search_router, prefix="/v1")
+router.include_router(metrics_router, prefix="/v1")
+router.include_router(export_router, prefix="/v1")
@@ -1,102 +1,148 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, selectinload
-
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload, selectinload
+
+from app.core.config import (
+    HTTP_CACHE_MAX_AGE_SECONDS,
+    LIST_DEFAULT_PAGE_SIZE,
+    LIST_MAX_PAGE_SIZE,
+    RANKING_CACHE_MAX_AGE_SECONDS,
+)
+from app.core.http_cache import conditional_get, conditional_get_async, etag_matches
+from app.core.pagination import after_cursor, decode_cursor, keyset_page
+from app.core.response_cache import entity_tags, response_cache
+from app.db.async_session import get_async_db
 from app.db.session import get_db
 from app.models.country import Country
+from app.models.country_framework import CountryFramework
 from app.models.country_indicator import CountryIndicator
+from app.models.country_institution import CountryInstitution
+from app.models.country_policy import CountryPolicy
+from app.models.country_target import CountryTarget
 from app.schemas.country import CountryOut, CountryDetailOut, CountryRankOut
+from app.services.country_ranking import InvalidWeights, normalize_weights, ranking_cache
 
 router = APIRouter(prefix="/countries", tags=["countries"])
 
 
-@router.get("", response_model=list[CountryOut])
-def list_countries(db: Session = Depends(get_db)):
-    return db.query(Country).order_by(Country.id.asc()).all()
+# Everything GET /countries/{id} embeds
+COUNTRY_DETAIL_TABLES = tuple(
+    model.__tablename__
+    for model in (
+        Country,
+        CountryIndicator,
+        CountryPolicy,
+        CountryFramework,
+        CountryInstitution,
+        CountryTarget,
+    )
+)
+
+
+@router.get(
+    "",
+    response_model=list[CountryOut],
+    dependencies=[Depends(conditional_get("countries", max_age=HTTP_CACHE_MAX_AGE_SECONDS))],
+)
+def list_countries(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    limit: int = Query(default=LIST_DEFAULT_PAGE_SIZE, ge=1, le=LIST_MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor header of the previous page"),
+):
+    """By id, keyset-paginated like /projects (X-Next-Cursor header)."""
+    query = db.query(Country).order_by(Country.id.asc())
+    if cursor:
+        query = query.filter(after_cursor([Country.id], decode_cursor(cursor, int)))
+    return response_cache.serve(
+        request,
+        response,
+        tags=entity_tags("countries"),
+        build=lambda: keyset_page(query, limit, lambda country: (country.id,)),
+        model=list[CountryOut],
+    )
 
 
 @router.get("/ranking", response_model=list[CountryRankOut])
-def country_ranking(db: Session = Depends(get_db)):
+def country_ranking(
+    request: Request,
+    policy_readiness: float | None = Query(default=None, ge=0),
+    investment_attractiveness: float | None = Query(default=None, ge=0),
+    renewable_proxy: float | None = Query(default=None, ge=0),
+    efficiency_need: float | None = Query(default=None, ge=0),
+    grid_proxy: float | None = Query(default=None, ge=0),
+    db: Session = Depends(get_db),
+):
     """
     Explainable MVP ranking based on normalized indicators (0..1).
     Score is normalized to 0..100.
 
+    Weights default to the curated set; pass any of them to override
+    (the set is rescaled to sum to 1, 0 leaves an indicator out).
+    Responses carry an ETag that changes with the indicator data, so
+    clients can revalidate with If-None-Match and get a 304.
+
     IMPORTANT: this is curated MVP scoring; be transparent in UI.
     """
-    # Weights must sum to 1.0
-    weights: dict[str, float] = {
-        "policy_readiness": 0.30,
-        "investment_attractiveness": 0.25,
-        "renewable_proxy": 0.25,
-        "efficiency_need": 0.10,
-        "grid_proxy": 0.10,
-    }
-
-    countries = db.query(Country).order_by(Country.id.asc()).all()
-    if not countries:
-        return []
-
-    # Load indicators in one query
-    rows = db.query(CountryIndicator).all()
-    by_country: dict[int, dict[str, CountryIndicator]] = {}
-    for r in rows:
-        by_country.setdefault(r.country_id, {})[r.key] = r
-
-    out: list[CountryRankOut] = []
-    for c in countries:
-        ind_map = by_country.get(c.id, {})
-
-        breakdown = []
-        weighted_sum = 0.0
-        weight_used = 0.0
-
-        for key, w in weights.items():
-            ind = ind_map.get(key)
-            v = float(ind.value) if ind else None  # normalized 0..1
-            if v is not None:
-                weighted_sum += v * w
-                weight_used += w
-
-            breakdown.append(
-                {
-                    "key": key,
-                    "value": v,
-                    "weight": w,
-                }
-            )
-
-        # Normalize if some indicators missing
-        score01 = (weighted_sum / weight_used) if weight_used > 0 else 0.0
-        score = int(round(score01 * 100))
-
-        out.append(
-            CountryRankOut(
-                country_id=c.id,
-                name=c.name,
-                iso2=c.iso2,
-                region=c.region,
-                score=score,
-                breakdown=breakdown,
-            )
+    try:
+        weights = normalize_weights(
+            {
+                "policy_readiness": policy_readiness,
+                "investment_attractiveness": investment_attractiveness,
+                "renewable_proxy": renewable_proxy,
+                "efficiency_need": efficiency_need,
+                "grid_proxy": grid_proxy,
+            }
         )
+    except InvalidWeights as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    out.sort(key=lambda x: x.score, reverse=True)
-    return out
-
-
-@router.get("/{country_id}", response_model=CountryDetailOut)
-def get_country(country_id: int, db: Session = Depends(get_db)):
-    country = (
-        db.query(Country)
-        .options(
-            selectinload(Country.indicators),
-            selectinload(Country.policies),
-            selectinload(Country.frameworks),
-            selectinload(Country.institutions),
-            selectinload(Country.targets),
+    cached = ranking_cache.get(db, weights)
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": f"public, max-age={RANKING_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/{country_id}",
+    response_model=CountryDetailOut,
+    dependencies=[Depends(conditional_get_async(*COUNTRY_DETAIL_TABLES, max_age=HTTP_CACHE_MAX_AGE_SECONDS))],
+)
+async def get_country(
+    country_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    async def load_country():
+        stmt = (
+            select(Country)
+            .options(
+                selectinload(Country.indicators),
+                selectinload(Country.policies),
+                selectinload(Country.frameworks),
+                selectinload(Country.institutions),
+                selectinload(Country.targets),
+                # Nothing else is serialized; never lazy-load on the async session
+                raiseload("*"),
+            )
+            .where(Country.id == country_id)
         )
-        .filter(Country.id == country_id)
-        .first()
+        country = (await db.execute(stmt)).scalar_one_or_none()
+        if not country:
+            raise HTTPException(status_code=404, detail="Country not found")
+        return country
+
+    return await response_cache.serve_async(
+        request,
+        response,
+        tags=entity_tags("countries", country_id),
+        build=load_country,
+        model=CountryDetailOut,
     )
-    if not country:
-        raise HTTPException(status_code=404, detail="Country not found")
-    return country
@@ -0,0 +1,172 @@
+"""
+Streaming bulk exports of the public datasets, as NDJSON or CSV.
+
+    GET /export/news.ndjson?country_id=cececo&q=solar
+    GET /export/projects.csv?kind=startup
+    GET /export/investors.ndjson?country_id=3
+
+Filters are the ones of the matching list endpoint. Rows are read through a
+server-side cursor (yield_per) and written one chunk at a time, so memory
+stays constant however large the table is and the database sees one query
+instead of a page per request. Rows are flat: nested countries become
+country_name/country_iso2 (projects, news) or a list of ISO2 codes
+(investors; ";"-separated in CSV).
+
+The export opens its own session inside the response generator: the
+request's get_db session is closed before a StreamingResponse body is
+sent.
+"""
+import csv
+import io
+from typing import Any, Callable, Iterator, Literal
+
+import orjson
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.v1.investors import countries_by_investor, filter_investors
+from app.api.v1.news import news_filters
+from app.api.v1.projects import filter_projects
+from app.core.responses import ORJSON_OPTIONS
+from app.db.projection import schema_columns
+from app.db.session import SessionLocal
+from app.models.country import Country
+from app.models.investor import Investor
+from app.models.news_item import NewsItem
+from app.models.project import Project
+from app.schemas.investor import InvestorOut
+from app.schemas.news_item import NewsItemOut
+from app.schemas.project import ProjectOut
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+EXPORT_CHUNK_SIZE = 1000
+
+ExportFormat = Literal["ndjson", "csv"]
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+COUNTRY_COLUMNS = [Country.name.label("country_name"), Country.iso2.label("country_iso2")]
+NEWS_COLUMNS = [*schema_columns(NewsItem, NewsItemOut), *COUNTRY_COLUMNS]
+PROJECT_COLUMNS = [*schema_columns(Project, ProjectOut), *COUNTRY_COLUMNS]
+INVESTOR_COLUMNS = schema_columns(Investor, InvestorOut)
+
+# Export field order (CSV header)
+NEWS_FIELDS = [c.name for c in NEWS_COLUMNS]
+PROJECT_FIELDS = [c.name for c in PROJECT_COLUMNS]
+INVESTOR_FIELDS = [c.name for c in INVESTOR_COLUMNS] + ["countries"]
+
+# Builds the export's row chunks on the export's own session
+ChunkSource = Callable[[Session], Iterator[list[dict[str, Any]]]]
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return ";".join(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _csv(lines) -> bytes:
+    out = io.StringIO()
+    csv.writer(out).writerows(lines)
+    return out.getvalue().encode()
+
+
+def _encode(rows: list[dict[str, Any]], fmt: ExportFormat, fields: list[str]) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(orjson.dumps(row, option=ORJSON_OPTIONS) + b"\n" for row in rows)
+    return _csv([_csv_value(row[f]) for f in fields] for row in rows)
+
+
+def _stream(name: str, fmt: ExportFormat, fields: list[str], chunks: ChunkSource) -> StreamingResponse:
+    def body() -> Iterator[bytes]:
+        db = SessionLocal()
+        try:
+            if fmt == "csv":
+                yield _csv([fields])
+            for rows in chunks(db):
+                yield _encode(rows, fmt, fields)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+def _partitions(db: Session, stmt) -> Iterator[list[dict[str, Any]]]:
+    # yield_per streams from a server-side cursor (stream_results) in chunks
+    result = db.execute(stmt.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+    for rows in result.partitions():
+        yield [row._asdict() for row in rows]
+
+
+@router.get("/news.{fmt}")
+def export_news(
+    fmt: ExportFormat,
+    country_id: str | int | None = None,
+    q: str | None = None,
+):
+    """Approved news, newest first; country_id ("cececo" or an id) and q as in GET /news."""
+
+    def chunks(db: Session) -> Iterator[list[dict[str, Any]]]:
+        stmt = (
+            select(*NEWS_COLUMNS)
+            .outerjoin(Country, Country.id == NewsItem.country_id)
+            .where(*news_filters(country_id, q))
+            .order_by(NewsItem.published_at.desc(), NewsItem.id.desc())
+        )
+        for rows in _partitions(db, stmt):
+            for row in rows:
+                row["country_name"] = row["country_name"] or "Global"
+            yield rows
+
+    return _stream("news", fmt, NEWS_FIELDS, chunks)
+
+
+@router.get("/projects.{fmt}")
+def export_projects(
+    fmt: ExportFormat,
+    kind: str | None = Query(default=None, description="project | startup"),
+    country_id: int | None = Query(default=None),
+    q: str | None = Query(default=None, description="Search title/summary"),
+):
+    """Projects, newest first (by relevance with q); filters as in GET /projects."""
+
+    def chunks(db: Session) -> Iterator[list[dict[str, Any]]]:
+        query = db.query(*PROJECT_COLUMNS).join(Country, Country.id == Project.country_id)
+        query = filter_projects(db, query, kind=kind, country_id=country_id, q=q)
+        if not q:
+            query = query.order_by(Project.created_at.desc(), Project.id.desc())
+        yield from _partitions(db, query.statement)
+
+    return _stream("projects", fmt, PROJECT_FIELDS, chunks)
+
+
+@router.get("/investors.{fmt}")
+def export_investors(
+    fmt: ExportFormat,
+    q: str | None = Query(default=None, description="Search name/sectors/stages"),
+    investor_type: str | None = Query(default=None, description="fund | angel | corporate | public | ngo"),
+    country_id: int | None = Query(default=None, description="Filter investors by supported country"),
+):
+    """Investors by name (by relevance with q) with their countries' ISO2 codes; filters as in GET /investors."""
+
+    def chunks(db: Session) -> Iterator[list[dict[str, Any]]]:
+        query = filter_investors(
+            db, db.query(*INVESTOR_COLUMNS), investor_type=investor_type, country_id=country_id, q=q
+        )
+        if not q:
+            query = query.order_by(Investor.name.asc(), Investor.id.asc())
+        for rows in _partitions(db, query.statement):
+            countries = countries_by_investor(db, [row["id"] for row in rows])
+            for row in rows:
+                row["countries"] = [c.iso2 for c in countries.get(row["id"], [])]
+            yield rows
+
+    return _stream("investors", fmt, INVESTOR_FIELDS, chunks)
@@ -1,41 +1,184 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 
+from app.core.config import (
+    HTTP_CACHE_MAX_AGE_SECONDS,
+    LIST_DEFAULT_PAGE_SIZE,
+    LIST_MAX_PAGE_SIZE,
+    LIST_STATEMENT_TIMEOUT_MS,
+)
+from app.core.http_cache import conditional_get
+from app.core.pagination import after_cursor, decode_cursor, keyset_page, reject_cursor_with_search
+from app.core.response_cache import entity_tags, response_cache
+from app.core.responses import json_response, model_response
+from app.db.projection import schema_columns
 from app.db.session import get_db
-from app.models.investor import Investor
+from app.db.statement_timeout import statement_timeout
+from app.models.investor import Investor, investor_countries
 from app.models.country import Country
-from app.schemas.investor import InvestorCreate, InvestorOut
+from app.models.project import Project
+from app.schemas.investor import CountryMini, InvestorCreate, InvestorOut
+from app.services.batch_matching import get_batch_matcher
+from app.services.investor_index import get_investor_index, invalidate_investor_index
+from app.services.match_cache import refresh_investor_matches
+from app.services.search import apply_text_search
 
 router = APIRouter(prefix="/investors", tags=["investors"])
 
+INVESTOR_COLUMNS = schema_columns(Investor, InvestorOut)
+COUNTRY_MINI_COLUMNS = schema_columns(Country, CountryMini)
+COUNTRY_CHUNK_SIZE = 500
 
-@router.get("", response_model=list[InvestorOut])
+
+def countries_by_investor(db: Session, investor_ids: list[int]) -> dict[int, list[CountryMini]]:
+    """Supported countries of each investor, read in one query per chunk of investors."""
+    countries: dict[int, list[CountryMini]] = {}
+    for start in range(0, len(investor_ids), COUNTRY_CHUNK_SIZE):
+        ids = investor_ids[start:start + COUNTRY_CHUNK_SIZE]
+        links = (
+            db.query(investor_countries.c.investor_id, *COUNTRY_MINI_COLUMNS)
+            .join(Country, Country.id == investor_countries.c.country_id)
+            .filter(investor_countries.c.investor_id.in_(ids))
+            .order_by(investor_countries.c.investor_id, Country.id)
+        )
+        for link in links:
+            values = link._asdict()
+            countries.setdefault(values.pop("investor_id"), []).append(CountryMini.model_construct(**values))
+    return countries
+
+
+def _investors_out(db: Session, rows) -> list[InvestorOut]:
+    countries = countries_by_investor(db, [row.id for row in rows])
+    # Validated, not constructed: website and contact_email are normalized
+    # by their AnyUrl/EmailStr types
+    return [
+        InvestorOut.model_validate({**row._asdict(), "countries": countries.get(row.id, [])})
+        for row in rows
+    ]
+
+
+def filter_investors(
+    db: Session, query, *, investor_type: str | None, country_id: int | None, q: str | None
+):
+    """The investors listing's filters (also used by the exports); q also orders by relevance."""
+    if investor_type:
+        query = query.filter(Investor.investor_type == investor_type)
+
+    if country_id is not None:
+        query = query.join(Investor.countries).filter(Country.id == country_id)
+
+    if q:
+        query = apply_text_search(
+            db,
+            query,
+            q,
+            [Investor.name, Investor.focus_sectors, Investor.stages],
+            Investor.name.asc(),
+        )
+    return query
+
+
+@router.get(
+    "",
+    response_model=list[InvestorOut],
+    dependencies=[
+        Depends(statement_timeout(LIST_STATEMENT_TIMEOUT_MS)),
+        Depends(conditional_get("investors", "countries", max_age=HTTP_CACHE_MAX_AGE_SECONDS)),
+    ],
+)
 def list_investors(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     q: str | None = Query(default=None, description="Search name/sectors/stages"),
     investor_type: str | None = Query(default=None, description="fund | angel | corporate | public | ngo"),
     country_id: int | None = Query(default=None, description="Filter investors by supported country"),
+    limit: int = Query(default=LIST_DEFAULT_PAGE_SIZE, ge=1, le=LIST_MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor header of the previous page"),
 ):
-    query = db.query(Investor)
-
-    if investor_type:
-        query = query.filter(Investor.investor_type == investor_type)
+    """
+    By name, keyset-paginated: at most `limit` investors per page; the
+    X-Next-Cursor response header (absent on the last page) is the `cursor`
+    of the next one. Search results (q) are ranked and return only the
+    best `limit` matches.
+    """
+    query = filter_investors(
+        db, db.query(*INVESTOR_COLUMNS), investor_type=investor_type, country_id=country_id, q=q
+    )
 
     if q:
-        like = f"%{q}%"
-        query = query.filter(
-            or_(
-                Investor.name.ilike(like),
-                Investor.focus_sectors.ilike(like),
-                Investor.stages.ilike(like),
-            )
-        )
+        reject_cursor_with_search(cursor)
+        return model_response(response, _investors_out(db, query.limit(limit).all()), list[InvestorOut])
 
-    if country_id is not None:
-        query = query.join(Investor.countries).filter(Country.id == country_id)
+    # id breaks name ties so keyset pages are stable
+    query = query.order_by(Investor.name.asc(), Investor.id.asc())
+    if cursor:
+        query = query.filter(after_cursor([Investor.name, Investor.id], decode_cursor(cursor, str, int)))
+    return response_cache.serve(
+        request,
+        response,
+        tags=entity_tags("investors", country_id),
+        build=lambda: keyset_page(
+            query,
+            limit,
+            lambda row: (row.name, row.id),
+            lambda rows: _investors_out(db, rows),
+        ),
+        model=list[InvestorOut],
+    )
+
+
+@router.get("/matches/bulk")
+def get_bulk_investor_matches(
+    kind: str | None = Query(default=None, description="Only match projects of this kind: project | startup"),
+    strict_country: bool = Query(
+        default=False,
+        description="If true, only projects in one of the investor's countries are returned",
+    ),
+    limit: int = Query(default=5, ge=1, le=50, description="Max number of projects returned per investor"),
+    db: Session = Depends(get_db),
+):
+    """
+    Best projects for every investor, from the same score matrix as
+    GET /projects/matches/bulk (ties broken by newest project id).
+    """
+    query = db.query(Project)
+    if kind:
+        query = query.filter(Project.kind == kind)
+    projects = query.all()
+
+    index = get_investor_index(db)
+    matches = get_batch_matcher(index).top_projects(
+        projects, limit=limit, strict_country=strict_country
+    )
 
-    return query.order_by(Investor.name.asc()).all()
+    investors = sorted(index.investors.values(), key=lambda inv: inv.name)
+    return json_response(None, [
+        {
+            "investor_id": inv.id,
+            "name": inv.name,
+            "matches": [
+                {
+                    "score": m["score"],
+                    "score_100": m["score_100"],
+                    "why": m["why"],
+                    "score_breakdown": m["score_breakdown"],
+                    "reason_points": m["reason_points"],
+                    "reasons": m["reasons"],
+                    "project": {
+                        "id": m["project"].id,
+                        "kind": m["project"].kind,
+                        "country_id": m["project"].country_id,
+                        "title": m["project"].title,
+                        "sector": m["project"].sector,
+                        "stage": m["project"].stage,
+                    },
+                }
+                for m in matches[inv.id]
+            ],
+        }
+        for inv in investors
+    ])
 
 
 @router.post("", response_model=InvestorOut, status_code=201)
@@ -61,6 +204,11 @@ def create_investor(payload: InvestorCreate, db: Session = Depends(get_db)):
         inv.countries = countries
 
     db.add(inv)
+    db.flush()
+    # Same transaction: the investor is never saved without its matches
+    refresh_investor_matches(db, inv)
     db.commit()
+    invalidate_investor_index()
+    response_cache.invalidate_entity("investors", *payload.country_ids)
     db.refresh(inv)
     return inv
@@ -1,30 +1,56 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.admin import require_admin
+from app.core.config import HTTP_CACHE_MAX_AGE_SECONDS, LIST_STATEMENT_TIMEOUT_MS
+from app.core.http_cache import conditional_get
+from app.core.response_cache import entity_tags, response_cache
+from app.core.responses import model_response
+from app.db.projection import construct_all, schema_columns
 from app.db.session import get_db
+from app.db.statement_timeout import statement_timeout
 from app.models.resource import Resource
 from app.schemas.resource import ResourceCreate, ResourceOut
+from app.services.search import apply_text_search
 
 router = APIRouter(prefix="/library", tags=["library"])
 
+RESOURCE_COLUMNS = schema_columns(Resource, ResourceOut)
 
-@router.get("", response_model=list[ResourceOut])
+
+@router.get(
+    "",
+    response_model=list[ResourceOut],
+    dependencies=[
+        Depends(statement_timeout(LIST_STATEMENT_TIMEOUT_MS)),
+        Depends(conditional_get("resources", max_age=HTTP_CACHE_MAX_AGE_SECONDS)),
+    ],
+)
 def list_resources(
+    request: Request,
+    response: Response,
     country_id: int | None = None,
     q: str | None = None,
     db: Session = Depends(get_db),
 ):
-    query = db.query(Resource).filter(Resource.status == "approved")
+    query = db.query(*RESOURCE_COLUMNS).filter(Resource.status == "approved")
 
     if country_id is not None:
         query = query.filter(Resource.country_id == country_id)
 
     if q:
-        like = f"%{q}%"
-        query = query.filter((Resource.title.ilike(like)) | (Resource.abstract.ilike(like)))
+        query = apply_text_search(db, query, q, [Resource.title, Resource.abstract], Resource.submitted_at.desc())
+        return model_response(response, construct_all(ResourceOut, query.limit(50)), list[ResourceOut])
 
-    return query.order_by(Resource.submitted_at.desc()).limit(50).all()
+    # Unsearched listings are few and hot: serve them from the response cache
+    query = query.order_by(Resource.submitted_at.desc())
+    return response_cache.serve(
+        request,
+        response,
+        tags=entity_tags("resources", country_id),
+        build=lambda: construct_all(ResourceOut, query.limit(50)),
+        model=list[ResourceOut],
+    )
 
 
 @router.post("/submit", response_model=ResourceOut)
@@ -59,6 +85,7 @@ def approve_resource(resource_id: int, db: Session = Depends(get_db)):
         return None
     item.status = "approved"
     db.commit()
+    response_cache.invalidate_entity("resources", item.country_id)
     db.refresh(item)
     return item
 
@@ -70,5 +97,6 @@ def reject_resource(resource_id: int, db: Session = Depends(get_db)):
         return None
     item.status = "rejected"
     db.commit()
+    response_cache.invalidate_entity("resources", item.country_id)
     db.refresh(item)
     return item
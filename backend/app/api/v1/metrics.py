@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from app.core.admin import require_admin
+from app.db.pool import pool_status
+from app.services.gdelt import gdelt_metrics
+
+router = APIRouter(prefix="/admin/metrics", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("")
+def get_metrics():
+    """
+    Operational metrics of this worker process.
+
+    db_pools: per engine, pool size, connections checked out / in, overflow
+    in use, saturation (checked out / (size + max_overflow)) and checkout
+    wait times; gdelt: request timings and retry counters of the GDELT client.
+    """
+    return {"db_pools": pool_status(), "gdelt": gdelt_metrics()}
+
+
+@router.get("/db")
+def get_db_pool_metrics():
+    return pool_status()
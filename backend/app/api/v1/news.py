@@ -1,27 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import or_
-from sqlalchemy.exc import IntegrityError
+import asyncio
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.admin import require_admin
+from app.core.config import LIST_STATEMENT_TIMEOUT_MS, NEWS_CACHE_MAX_AGE_SECONDS
+from app.core.http_cache import conditional_get_async
+from app.core.response_cache import entity_tags, response_cache
+from app.core.responses import json_response
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.async_session import get_async_db
+from app.db.projection import schema_columns
 from app.db.session import get_db
+from app.db.statement_timeout import statement_timeout_async
 from app.models.news_item import NewsItem
 from app.models.country import Country
-from app.schemas.news_item import NewsItemCreate, NewsItemOut
+from app.schemas.news_item import NewsItemCreate, NewsItemOut, NewsPageOut
 from app.services.news_scoring import compute_impact_score
-from app.services.gdelt import fetch_gdelt_news, map_gdelt_to_news_item
-from app.services.country_matching import match_country_from_gdelt
+from app.services.ingest_jobs import IngestJobConflict, IngestParams, ingest_jobs
+from app.services.news_ingest import DEFAULT_BATCH_SIZE
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+NEWS_COLUMNS = schema_columns(NewsItem, NewsItemOut)
+NEWS_FIELDS = tuple(NewsItemOut.model_fields)
+
 
-@router.get("")
-def list_news(
+@router.get(
+    "",
+    response_model=NewsPageOut,
+    dependencies=[
+        Depends(statement_timeout_async(LIST_STATEMENT_TIMEOUT_MS)),
+        Depends(conditional_get_async("news_items", "countries", max_age=NEWS_CACHE_MAX_AGE_SECONDS)),
+    ],
+)
+async def list_news(
+    request: Request,
+    response: Response,
     country_id: str | int | None = None,
     q: str | None = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    cursor: str | None = None,
+    include_total: bool = True,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Fetch news from database with pagination.
@@ -31,233 +57,199 @@ def list_news(
     - "cececo": Only CECECO countries (exclude global)
     - int: Specific country ID
     
+    Pagination:
+    - offset/limit as before, or
+    - cursor: pass the previous page's next_cursor to continue after it
+      (keyset on (published_at, id); offset is ignored)
+    - include_total=false skips the COUNT query ("total" is null)
+    
     Returns:
     {
         "items": [...],
-        "total": int,
+        "total": int | null,
         "limit": int,
         "offset": int,
-        "has_more": bool
+        "has_more": bool,
+        "next_cursor": str | null
     }
+
+    First pages without a search query are served from the response cache.
     """
-    # Get all countries for name/ISO2 lookup and filtering
-    all_countries = db.query(Country).all()
-    country_by_id = {c.id: c for c in all_countries}
-    
-    # Build query - only approved items
-    query = db.query(NewsItem).filter(NewsItem.status == "approved")
+    async def build():
+        return await _news_page(db, country_id, q, limit, offset, cursor, include_total)
+
+    if q or cursor or offset:
+        return json_response(response, await build())
+    return await response_cache.serve_async(
+        request,
+        response,
+        tags=entity_tags("news", _country_filter(country_id)),
+        build=build,
+        model=NewsPageOut,
+    )
+
+
+def _country_filter(country_id: str | int | None) -> int | None:
+    """The single country a news listing is filtered to, if any."""
+    if country_id is None or country_id == "cececo":
+        return None
+    try:
+        return int(country_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def news_filters(country_id: str | int | None, q: str | None) -> list:
+    """WHERE clauses of the approved news feed (also used by the exports)."""
+    clauses = [NewsItem.status == "approved"]
     
     # Handle country filter
     if country_id == "cececo":
         # CECECO countries only (exclude global/null)
-        country_ids = [c.id for c in all_countries]
-        query = query.filter(NewsItem.country_id.in_(country_ids))
+        clauses.append(NewsItem.country_id.in_(select(Country.id)))
     elif country_id is not None:
         try:
-            country_id_int = int(country_id)
-            query = query.filter(NewsItem.country_id == country_id_int)
+            clauses.append(NewsItem.country_id == int(country_id))
         except (ValueError, TypeError):
             pass  # Invalid country_id, ignore filter
     
     # Handle search query
     if q:
         search_term = f"%{q}%"
-        query = query.filter(
+        clauses.append(
             or_(
                 NewsItem.title.ilike(search_term),
                 NewsItem.summary.ilike(search_term),
             )
         )
+    return clauses
+
+
+async def _news_page(
+    db: AsyncSession,
+    country_id: str | int | None,
+    q: str | None,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    include_total: bool,
+) -> dict:
+    # Get all countries for name/ISO2 lookup and filtering
+    # (columns only: loading Country entities would pull in their relationships)
+    all_countries = (await db.execute(select(Country.id, Country.name, Country.iso2))).all()
+    country_by_id = {c.id: c for c in all_countries}
+    
+    # Build query - only approved items, filtered like every news listing
+    stmt = select(*NEWS_COLUMNS).where(*news_filters(country_id, q))
     
     # Get total count before pagination
-    total = query.count()
+    total = None
+    if include_total:
+        total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
     
     # Execute query with pagination and enrich with country info
-    items = query.order_by(NewsItem.published_at.desc()).offset(offset).limit(limit).all()
+    # (id breaks published_at ties so keyset pages are stable)
+    stmt = stmt.order_by(NewsItem.published_at.desc(), NewsItem.id.desc())
+    if cursor:
+        after_published_at, after_id = decode_cursor(cursor, datetime, int)
+        stmt = stmt.where(
+            tuple_(NewsItem.published_at, NewsItem.id) < tuple_(after_published_at, after_id)
+        )
+        offset = 0
+    else:
+        stmt = stmt.offset(offset)
+    # One extra row tells us whether another page exists
+    items = (await db.execute(stmt.limit(limit + 1))).all()
+    has_more = len(items) > limit
+    items = items[:limit]
     
-    # Convert to NewsItemOut format with country info
+    # NewsItemOut-shaped dicts with country info (from country_by_id),
+    # serialized as they are
     result = []
     for item in items:
         country = country_by_id.get(item.country_id) if item.country_id else None
-        result.append(NewsItemOut(
-            id=item.id,
-            country_id=item.country_id,
-            country_name=country.name if country else "Global",
-            country_iso2=country.iso2 if country else None,
-            status=item.status,
-            impact_type=item.impact_type,
-            impact_score=item.impact_score,
-            title=item.title,
-            summary=item.summary,
-            tags=item.tags,
-            source_name=item.source_name,
-            source_url=item.source_url,
-            image_url=item.image_url,
-            published_at=item.published_at,
-            created_at=item.created_at,
-        ))
+        values = item._asdict()
+        values["country_name"] = country.name if country else "Global"
+        values["country_iso2"] = country.iso2 if country else None
+        result.append({field: values[field] for field in NEWS_FIELDS})
     
     return {
         "items": result,
         "total": total,
         "limit": limit,
         "offset": offset,
-        "has_more": offset + limit < total,
+        "has_more": has_more,
+        "next_cursor": (
+            encode_cursor(items[-1].published_at, items[-1].id) if has_more and items else None
+        ),
     }
 
 
-@router.post("/ingest/gdelt", dependencies=[Depends(require_admin)])
+@router.post("/ingest/gdelt", status_code=202, dependencies=[Depends(require_admin)])
 async def ingest_gdelt_news(
     max_records: int = 5000,
     per_country: int = 500,
     global_limit: int = 2000,
     timespan: str = "7d",
     auto_approve: bool = False,
-    db: Session = Depends(get_db),
+    batch_size: int = Query(default=DEFAULT_BATCH_SIZE, ge=1, le=5000),
+    incremental: bool = True,
+    wait: bool = False,
 ):
     """
-    Ingest news from GDELT API and store in database.
+    Start a background job that ingests news from GDELT API into the database.
     No limit on how much can be preloaded - all fetched articles are stored.
-    Returns count of inserted and skipped articles.
+    Returns the job; poll GET /news/ingest/jobs/{id} for progress.
     
     Args:
         max_records: Legacy parameter (now uses per_country * num_countries + global_limit)
         per_country: Number of articles to fetch per country (default: 500)
         global_limit: Number of global articles to fetch (default: 2000)
-        timespan: Time range for news (default: "7d")
+        timespan: Time range for news (default: "7d"); split into windows when a
+            limit exceeds GDELT's 250-records-per-request cap
         auto_approve: If True, news items are created with status="approved" (default: False)
+        batch_size: Number of articles written per INSERT statement (default: 500)
+        incremental: If True, each country only fetches articles newer than its
+            stored watermark (minus a small overlap), bounded by timespan
+        wait: If True, wait for the job to finish and return its final state
     """
-    all_countries = db.query(Country).all()
-    iso2_to_country = {c.iso2.upper(): c for c in all_countries}
-    
-    # Fetch from all CECECO countries in parallel
-    import asyncio
-    
-    # Track which country each fetch is for
-    country_tasks = [
-        (country, fetch_gdelt_news(
-            country_iso2=country.iso2,
-            search_query=None,
-            max_records=per_country,
-            timespan=timespan,
-        ))
-        for country in all_countries
-    ]
-    
-    # Also fetch global articles (no country filter)
-    global_task = (None, fetch_gdelt_news(
-        country_iso2=None,
-        search_query=None,
-        max_records=global_limit,
+    params = IngestParams(
+        per_country=per_country,
+        global_limit=global_limit,
         timespan=timespan,
-    ))
-    
-    # Execute all tasks
-    all_tasks = [task for _, task in country_tasks] + [global_task[1]]
-    results = await asyncio.gather(*all_tasks, return_exceptions=True)
-    
-    # Combine articles with their country context
-    gdelt_articles_with_context = []
-    seen_urls = set()
-    
-    # Process country-specific results
-    for i, (country, _) in enumerate(country_tasks):
-        result = results[i]
-        if isinstance(result, Exception):
-            continue
-        for article in result:
-            url = article.get("url") or article.get("url_mobile")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                # Tag article with the country we fetched for
-                gdelt_articles_with_context.append((article, country))
-    
-    # Process global results
-    global_result = results[len(country_tasks)]
-    if not isinstance(global_result, Exception):
-        for article in global_result:
-            url = article.get("url") or article.get("url_mobile")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                gdelt_articles_with_context.append((article, None))
-    
-    # Map and insert articles
-    inserted = 0
-    skipped = 0
-    
-    for article, fetch_country in gdelt_articles_with_context:
-        try:
-            # Match country - if we fetched with a country filter, prioritize that country
-            if fetch_country:
-                # When we fetch with sourcecountry filter, articles should be from that country
-                # Try matching first to see if GDELT confirms it
-                matched_id, matched_name, matched_iso2 = match_country_from_gdelt(
-                    article, all_countries
-                )
-                # If match confirms the fetch country, use it; otherwise use fetch country as fallback
-                if matched_id == fetch_country.id:
-                    country_id, country_name, country_iso2 = matched_id, matched_name, matched_iso2
-                else:
-                    # Use the country we filtered for (most reliable)
-                    country_id = fetch_country.id
-                    country_name = fetch_country.name
-                    country_iso2 = fetch_country.iso2
-            else:
-                # For global articles, try to match from content
-                country_id, country_name, country_iso2 = match_country_from_gdelt(
-                    article, all_countries
-                )
-            
-            # Map to news item format
-            mapped = map_gdelt_to_news_item(
-                article,
-                country_id=country_id,
-                country_name=country_name,
-                country_iso2=country_iso2,
-            )
-            
-            # Check if article already exists (by source_url)
-            if mapped["source_url"]:
-                existing = db.query(NewsItem).filter(
-                    NewsItem.source_url == mapped["source_url"]
-                ).first()
-                if existing:
-                    skipped += 1
-                    continue
-            
-            # Create new news item
-            status = "approved" if auto_approve else "pending"
-            item = NewsItem(
-                country_id=mapped["country_id"],
-                status=status,
-                impact_type=mapped["impact_type"],
-                impact_score=mapped["impact_score"],
-                title=mapped["title"],
-                summary=mapped["summary"],
-                tags=mapped["tags"],
-                source_name=mapped["source_name"],
-                source_url=mapped["source_url"],
-                image_url=mapped.get("image_url"),
-                published_at=mapped["published_at"],
-            )
-            db.add(item)
-            try:
-                db.commit()
-                inserted += 1
-            except IntegrityError:
-                # Unique constraint violation (duplicate source_url)
-                db.rollback()
-                skipped += 1
-        except Exception:
-            db.rollback()
-            skipped += 1
-            continue
+        auto_approve=auto_approve,
+        batch_size=batch_size,
+        incremental=incremental,
+    )
+    try:
+        job = ingest_jobs.start(params)
+    except IngestJobConflict as e:
+        raise HTTPException(status_code=409, detail=f"Ingest job {e.running.id} is already running")
     
-    return {
-        "inserted": inserted,
-        "skipped": skipped,
-        "total_fetched": len(gdelt_articles_with_context),
-    }
+    if wait:
+        await asyncio.wait([job.task])
+    return job.as_dict()
+
+
+@router.get("/ingest/jobs", dependencies=[Depends(require_admin)])
+def list_ingest_jobs():
+    return [job.as_dict() for job in ingest_jobs.list()]
+
+
+@router.get("/ingest/jobs/{job_id}", dependencies=[Depends(require_admin)])
+def get_ingest_job(job_id: str):
+    job = ingest_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return job.as_dict()
+
+
+@router.post("/ingest/jobs/{job_id}/cancel", dependencies=[Depends(require_admin)])
+def cancel_ingest_job(job_id: str):
+    job = ingest_jobs.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return job.as_dict()
 
 
 @router.get("/pending", response_model=list[NewsItemOut], dependencies=[Depends(require_admin)])
@@ -299,6 +291,8 @@ def create_news(payload: NewsItemCreate, db: Session = Depends(get_db)):
     )
     db.add(item)
     db.commit()
+    if status == "approved":
+        response_cache.invalidate_entity("news", item.country_id)
     db.refresh(item)
     return item
 
@@ -310,6 +304,7 @@ def approve_news(news_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="News not found")
     item.status = "approved"
     db.commit()
+    response_cache.invalidate_entity("news", item.country_id)
     db.refresh(item)
     return item
 
@@ -321,5 +316,6 @@ def reject_news(news_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="News not found")
     item.status = "rejected"
     db.commit()
+    response_cache.invalidate_entity("news", item.country_id)
     db.refresh(item)
     return item
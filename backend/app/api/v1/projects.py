@@ -1,25 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import or_
+from datetime import datetime
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    HTTP_CACHE_MAX_AGE_SECONDS,
+    LIST_DEFAULT_PAGE_SIZE,
+    LIST_MAX_PAGE_SIZE,
+    LIST_STATEMENT_TIMEOUT_MS,
+)
+from app.core.http_cache import conditional_get
+from app.core.pagination import (
+    DatetimeKey,
+    after_cursor,
+    decode_cursor,
+    keyset_page,
+    reject_cursor_with_search,
+)
+from app.core.response_cache import entity_tags, response_cache
+from app.core.responses import json_response, model_response
+from app.db.projection import pop_prefixed, schema_columns
 from app.db.session import get_db
+from app.db.statement_timeout import statement_timeout
+from app.models.country import Country
 from app.models.project import Project
-from app.models.investor import Investor
+from app.schemas.country import CountryOut
 from app.schemas.project import ProjectCreate, ProjectOut
-from app.services.matching import build_matches
+from app.services.batch_matching import get_batch_matcher
+from app.services.investor_index import get_investor_index
+from app.services.match_cache import get_stored_matches, refresh_project_matches
+from app.services.search import apply_text_search
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# ProjectOut columns plus its nested country, labeled "country__<field>"
+PROJECT_COLUMNS = [
+    *schema_columns(Project, ProjectOut),
+    *schema_columns(Country, CountryOut, prefix="country__"),
+]
 
-@router.get("", response_model=list[ProjectOut])
-def list_projects(
-    db: Session = Depends(get_db),
-    kind: str | None = Query(default=None, description="project | startup"),
-    country_id: int | None = Query(default=None),
-    q: str | None = Query(default=None, description="Search title/summary"),
-):
-    query = db.query(Project)
 
+def _project_out(row) -> ProjectOut:
+    values = row._asdict()
+    country = CountryOut.model_construct(**pop_prefixed(values, "country__"))
+    return ProjectOut.model_construct(**values, country=country)
+
+
+def filter_projects(db: Session, query, *, kind: str | None, country_id: int | None, q: str | None):
+    """The projects listing's filters (also used by the exports); q also orders by relevance."""
     if kind:
         query = query.filter(Project.kind == kind)
 
@@ -27,10 +55,60 @@ def list_projects(
         query = query.filter(Project.country_id == country_id)
 
     if q:
-        like = f"%{q}%"
-        query = query.filter(or_(Project.title.ilike(like), Project.summary.ilike(like)))
+        query = apply_text_search(db, query, q, [Project.title, Project.summary], Project.created_at.desc())
+    return query
+
+
+@router.get(
+    "",
+    response_model=list[ProjectOut],
+    dependencies=[
+        Depends(statement_timeout(LIST_STATEMENT_TIMEOUT_MS)),
+        Depends(conditional_get("projects", "countries", max_age=HTTP_CACHE_MAX_AGE_SECONDS)),
+    ],
+)
+def list_projects(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    kind: str | None = Query(default=None, description="project | startup"),
+    country_id: int | None = Query(default=None),
+    q: str | None = Query(default=None, description="Search title/summary"),
+    limit: int = Query(default=LIST_DEFAULT_PAGE_SIZE, ge=1, le=LIST_MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor header of the previous page"),
+):
+    """
+    Newest first, keyset-paginated: at most `limit` projects per page; the
+    X-Next-Cursor response header (absent on the last page) is the `cursor`
+    of the next one. Search results (q) are ranked and return only the
+    best `limit` matches.
+    """
+    query = db.query(*PROJECT_COLUMNS).join(Country, Country.id == Project.country_id)
+    query = filter_projects(db, query, kind=kind, country_id=country_id, q=q)
+
+    if q:
+        reject_cursor_with_search(cursor)
+        return model_response(response, [_project_out(row) for row in query.limit(limit)], list[ProjectOut])
 
-    return query.order_by(Project.created_at.desc()).all()
+    # id breaks created_at ties so keyset pages are stable
+    created_at = DatetimeKey(Project.created_at)
+    query = query.order_by(created_at.desc(), Project.id.desc())
+    if cursor:
+        query = query.filter(
+            after_cursor([created_at, Project.id], decode_cursor(cursor, datetime, int), descending=True)
+        )
+    return response_cache.serve(
+        request,
+        response,
+        tags=entity_tags("projects", country_id),
+        build=lambda: keyset_page(
+            query,
+            limit,
+            lambda row: (row.created_at, row.id),
+            lambda rows: [_project_out(row) for row in rows],
+        ),
+        model=list[ProjectOut],
+    )
 
 
 @router.post("", response_model=ProjectOut, status_code=201)
@@ -45,11 +123,82 @@ def create_project(payload: ProjectCreate, db: Session = Depends(get_db)):
         website=str(payload.website) if getattr(payload, "website", None) else None,
     )
     db.add(obj)
+    db.flush()
+    # Same transaction: the project is never saved without its matches
+    refresh_project_matches(db, [obj])
     db.commit()
+    response_cache.invalidate_entity("projects", obj.country_id)
     db.refresh(obj)
     return obj
 
 
+def _serialize_match(m: dict) -> dict:
+    return {
+        "score": m["score"],                 # legacy
+        "score_100": m["score_100"],         # new
+        "why": m["why"],                     # new
+        "score_breakdown": m["score_breakdown"],  # new
+        "reason_points": m["reason_points"],       # new
+        "reasons": m["reasons"],             # legacy (keep)
+        "investor": {
+            "id": m["investor"].id,
+            "name": m["investor"].name,
+            "investor_type": m["investor"].investor_type,
+            "focus_sectors": m["investor"].focus_sectors,
+            "stages": m["investor"].stages,
+            "ticket_min": m["investor"].ticket_min,
+            "ticket_max": m["investor"].ticket_max,
+            "website": m["investor"].website,
+            "contact_email": m["investor"].contact_email,
+            "countries": [
+                {"id": c.id, "name": c.name, "iso2": c.iso2}
+                for c in (m["investor"].countries or [])
+            ],
+        },
+    }
+
+
+@router.get("/matches/bulk")
+def get_bulk_project_matches(
+    kind: str | None = Query(default=None, description="project | startup"),
+    country_id: int | None = Query(default=None),
+    strict_country: bool = Query(
+        default=False,
+        description="If true, only investors with matching country are returned",
+    ),
+    limit: int = Query(
+        default=5,
+        ge=1,
+        le=50,
+        description="Max number of matches returned per project",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Best investors for every project in the directory, scored in one
+    vectorized pass. Each project's matches are the same as
+    GET /projects/{id}/matches with the same strict_country/limit.
+    """
+    query = db.query(Project)
+    if kind:
+        query = query.filter(Project.kind == kind)
+    if country_id is not None:
+        query = query.filter(Project.country_id == country_id)
+    projects = query.order_by(Project.created_at.desc()).all()
+
+    matcher = get_batch_matcher(get_investor_index(db))
+    matches = matcher.top_investors(projects, limit=limit, strict_country=strict_country)
+
+    return json_response(None, [
+        {
+            "project_id": p.id,
+            "title": p.title,
+            "matches": [_serialize_match(m) for m in matches[p.id]],
+        }
+        for p in projects
+    ])
+
+
 @router.get("/{project_id}/matches")
 def get_project_matches(
     project_id: int,
@@ -69,32 +218,7 @@ def get_project_matches(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    investors = db.query(Investor).options(selectinload(Investor.countries)).all()
-    matches = build_matches(project, investors, strict_country=strict_country, limit=limit)
+    # Stored scores: one indexed read, strict_country/limit applied in SQL
+    matches = get_stored_matches(db, project, strict_country=strict_country, limit=limit)
 
-    return [
-        {
-            "score": m["score"],                 # legacy
-            "score_100": m["score_100"],         # new
-            "why": m["why"],                     # new
-            "score_breakdown": m["score_breakdown"],  # new
-            "reason_points": m["reason_points"],       # new
-            "reasons": m["reasons"],             # legacy (keep)
-            "investor": {
-                "id": m["investor"].id,
-                "name": m["investor"].name,
-                "investor_type": m["investor"].investor_type,
-                "focus_sectors": m["investor"].focus_sectors,
-                "stages": m["investor"].stages,
-                "ticket_min": m["investor"].ticket_min,
-                "ticket_max": m["investor"].ticket_max,
-                "website": m["investor"].website,
-                "contact_email": m["investor"].contact_email,
-                "countries": [
-                    {"id": c.id, "name": c.name, "iso2": c.iso2}
-                    for c in (m["investor"].countries or [])
-                ],
-            },
-        }
-        for m in matches
-    ]
+    return json_response(None, [_serialize_match(m) for m in matches])
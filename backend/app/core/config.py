@@ -10,3 +10,65 @@ DATABASE_URL = os.getenv(
 )
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-me")
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# GDELT client: shared connection pool, concurrency cap, rate limit and retries
+GDELT_BASE_URL = os.getenv("GDELT_BASE_URL", "https://api.gdeltproject.org/api/v2/doc/doc")
+GDELT_MAX_CONCURRENCY = int(os.getenv("GDELT_MAX_CONCURRENCY", "4"))
+GDELT_RATE_PER_SECOND = float(os.getenv("GDELT_RATE_PER_SECOND", "2"))
+GDELT_RATE_BURST = int(os.getenv("GDELT_RATE_BURST", "4"))
+GDELT_MAX_RETRIES = int(os.getenv("GDELT_MAX_RETRIES", "3"))
+GDELT_BACKOFF_SECONDS = float(os.getenv("GDELT_BACKOFF_SECONDS", "1.0"))
+GDELT_TIMEOUT_SECONDS = float(os.getenv("GDELT_TIMEOUT_SECONDS", "30"))
+
+# Scheduled incremental GDELT ingest (0 disables the in-process scheduler)
+GDELT_INGEST_INTERVAL_MINUTES = float(os.getenv("GDELT_INGEST_INTERVAL_MINUTES", "0"))
+GDELT_INGEST_TIMESPAN = os.getenv("GDELT_INGEST_TIMESPAN", "1d")
+GDELT_INGEST_AUTO_APPROVE = os.getenv("GDELT_INGEST_AUTO_APPROVE", "false").lower() == "true"
+GDELT_INGEST_OVERLAP_MINUTES = float(os.getenv("GDELT_INGEST_OVERLAP_MINUTES", "30"))
+
+# Investor matching index: rebuilt on investor writes, or after this many seconds
+INVESTOR_INDEX_TTL_SECONDS = float(os.getenv("INVESTOR_INDEX_TTL_SECONDS", "300"))
+
+# Search: how long "are the search_vector columns / pg_trgm there" is cached,
+# so a migration run against a live process is picked up
+SEARCH_FEATURE_CHECK_TTL_SECONDS = float(os.getenv("SEARCH_FEATURE_CHECK_TTL_SECONDS", "300"))
+
+# Country ranking: cached per (indicator data version, weights), LRU-evicted
+RANKING_CACHE_SIZE = int(os.getenv("RANKING_CACHE_SIZE", "32"))
+RANKING_CACHE_MAX_AGE_SECONDS = int(os.getenv("RANKING_CACHE_MAX_AGE_SECONDS", "60"))
+
+# Cache-Control max-age of the conditional GET routes (clients revalidate after it)
+HTTP_CACHE_MAX_AGE_SECONDS = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", "60"))
+NEWS_CACHE_MAX_AGE_SECONDS = int(os.getenv("NEWS_CACHE_MAX_AGE_SECONDS", "30"))
+
+# Response cache for hot read endpoints: "memory" (per process), "off",
+# or a redis:// URL shared by all workers (needs the redis package)
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "memory")
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+
+# Async engine for the async routes; derived from DATABASE_URL when unset
+# (postgresql+psycopg works as is, e.g. postgresql+asyncpg://... also works)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "")
+
+# Database connection pool (per engine; the async engine gets its own pool)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+# Replace connections older than this (-1 keeps them forever)
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+# Round-trip to test each connection on checkout; with a recycle interval
+# shorter than the server's idle timeout it can usually be turned off
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Behind PgBouncer in transaction mode: no server-side prepared statements,
+# and connections are not pooled in the app (PgBouncer pools them)
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+# Per-route statement_timeout in milliseconds (0 = server default)
+SEARCH_STATEMENT_TIMEOUT_MS = int(os.getenv("SEARCH_STATEMENT_TIMEOUT_MS", "5000"))
+LIST_STATEMENT_TIMEOUT_MS = int(os.getenv("LIST_STATEMENT_TIMEOUT_MS", "10000"))
+
+# Keyset-paginated directory listings (countries, projects, investors):
+# default page size, and the hard cap on ?limit=
+LIST_DEFAULT_PAGE_SIZE = int(os.getenv("LIST_DEFAULT_PAGE_SIZE", "100"))
+LIST_MAX_PAGE_SIZE = int(os.getenv("LIST_MAX_PAGE_SIZE", "500"))
@@ -0,0 +1,133 @@
+"""
+Conditional GET support: ETag / Last-Modified validators and 304 responses.
+
+conditional_get(*tables) builds a route dependency that derives a weak ETag
+from the request URL and the table_versions counters of the tables the
+route reads. A matching If-None-Match (or, without one, If-Modified-Since)
+raises NotModified before the route body runs, so warm revalidations cost
+one primary-key lookup and no ORM work; main.py turns it into a 304.
+conditional_get_async does the same for routes on the AsyncSession.
+
+The versions are also left on request.state.table_versions, where the
+response cache picks them up as part of its key.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.async_session import get_async_db
+from app.db.session import get_db
+from app.db.table_versions import get_table_versions
+
+
+class NotModified(Exception):
+    """The client's cached copy is current; answered with 304 and these headers."""
+
+    def __init__(self, headers: dict[str, str]):
+        super().__init__("Not Modified")
+        self.headers = headers
+
+
+def make_etag(*parts) -> str:
+    """Quoted strong ETag derived from the given values."""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value matches etag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; the DB clock is UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _parse_http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_validators(
+    request: Request,
+    response: Response,
+    versions: dict[str, tuple[int, datetime | None]],
+    max_age: int,
+) -> None:
+    # The response cache keys bodies by these, so a body is never served
+    # under the ETag of other table versions
+    request.state.table_versions = versions
+    etag = "W/" + make_etag(
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        *(f"{table}:{version}" for table, (version, _) in versions.items()),
+    )
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, must-revalidate",
+    }
+
+    # Only known when every table has been written since tracking began
+    timestamps = [updated_at for _, updated_at in versions.values()]
+    last_modified = None
+    if all(timestamps):
+        last_modified = max(_as_utc(ts) for ts in timestamps).replace(microsecond=0)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+        if etag_matches(if_none_match, etag):
+            raise NotModified(headers)
+    elif last_modified is not None:
+        since = _parse_http_date(request.headers.get("if-modified-since"))
+        if since is not None and last_modified <= since:
+            raise NotModified(headers)
+
+    response.headers.update(headers)
+
+
+def conditional_get(*tables: str, max_age: int = 0):
+    """
+    Dependency factory for cacheable GET routes.
+
+    tables are every table the response is built from; any write to one of
+    them changes the ETag. max_age is the Cache-Control freshness lifetime
+    in seconds (0 means clients always revalidate).
+    """
+
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        _check_validators(request, response, get_table_versions(db, tables), max_age)
+
+    return dependency
+
+
+def conditional_get_async(*tables: str, max_age: int = 0):
+    """conditional_get for async routes (reads the versions on the AsyncSession)."""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+    ) -> None:
+        versions = await db.run_sync(get_table_versions, tables)
+        _check_validators(request, response, versions, max_age)
+
+    return dependency
@@ -0,0 +1,132 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row of a page, e.g.
+(published_at, id); the next page continues strictly after it.
+
+Directory listings (countries, projects, investors) keep returning a JSON
+array and announce the next page in the X-Next-Cursor response header
+(absent on the last page); clients pass it back as ?cursor=. GET /news
+predates them and returns next_cursor in its JSON body instead, next to
+offset and total.
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import literal, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.functions import FunctionElement
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor, converting each value to the
+    given type (datetime values are parsed from ISO format).
+    Raises HTTPException(400) for malformed cursors.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            None if v is None
+            else datetime.fromisoformat(v) if t is datetime
+            else t(v)
+            for v, t in zip(values, types)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def reject_cursor_with_search(cursor: str | None) -> None:
+    """Ranked search results have no stable sort key to continue after."""
+    if cursor:
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with q")
+
+
+class DatetimeKey(FunctionElement):
+    """
+    A datetime column as a sort key, for ORDER BY and after_cursor alike.
+
+    SQLite stores datetimes as text, and not always in the format bound
+    parameters are rendered in (server_default now() has no fractional
+    seconds), so a row can compare below a cursor built from its own
+    value; there the key is julianday(column). Other dialects compile it
+    to the bare column.
+    """
+
+    inherit_cache = True
+    name = "datetime_key"
+
+    def __init__(self, column: Any):
+        super().__init__(column)
+        self.type = column.type
+
+
+@compiles(DatetimeKey)
+def _compile_datetime_key(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(DatetimeKey, "sqlite")
+def _compile_datetime_key_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+def after_cursor(columns: Sequence[Any], values: Sequence[Any], *, descending: bool = False):
+    """
+    WHERE clause continuing a (columns) ordered listing strictly after values.
+    DatetimeKey columns are compared against the value's DatetimeKey.
+    """
+    values = [
+        DatetimeKey(literal(value, column.type)) if isinstance(column, DatetimeKey) else value
+        for column, value in zip(columns, values)
+    ]
+    if len(columns) == 1:
+        return columns[0] < values[0] if descending else columns[0] > values[0]
+    key, after = tuple_(*columns), tuple_(*values)
+    return key < after if descending else key > after
+
+
+@dataclass
+class Page:
+    """One page of a keyset listing: the items and the cursor of the next page."""
+
+    items: list
+    next_cursor: str | None = None
+    headers: dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.headers = {NEXT_CURSOR_HEADER: self.next_cursor} if self.next_cursor else {}
+
+
+def keyset_page(
+    query: Query,
+    limit: int,
+    cursor_key: Callable[[Any], tuple],
+    to_items: Callable[[list], list] = list,
+) -> Page:
+    """
+    Run an already ordered (and cursor-filtered) query for one page.
+    cursor_key maps a row to the values of its sort key; to_items turns the
+    page's rows into the response items.
+    """
+    # One extra row tells us whether another page exists
+    rows = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(*cursor_key(rows[limit - 1])) if len(rows) > limit else None
+    return Page(to_items(rows[:limit]), next_cursor)
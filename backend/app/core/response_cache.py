@@ -0,0 +1,293 @@
+"""
+Tagged response cache for hot read endpoints.
+
+Routes serve their JSON through response_cache.serve(), which stores the
+serialized body (and its pagination headers) under the request path +
+query string together with tags naming the entity and countries it was
+built from:
+
+    "<entity>"                 every cached response of that entity
+    "<entity>:all"             responses not filtered to one country
+    "<entity>:country:<id>"    responses filtered to that country
+
+Routes guarded by conditional_get also key their entries by the
+table_versions it read, so a write makes every worker build a new body
+under the new ETag even if the invalidation below never reached it (other
+worker processes with the memory backend, or a commit racing with the
+invalidation).
+
+Mutation endpoints call invalidate_entity("news", item.country_id) and
+exactly the affected entries are evicted: that country's lists and the
+unfiltered ones. Entries also expire after a TTL, which bounds staleness
+for writes the app does not see.
+
+Backends:
+    MemoryBackend   in-process LRU + TTL (default)
+    RedisBackend    shared; takes any redis-py compatible client, so a fake
+                    server (e.g. fakeredis.FakeRedis()) can stand in for tests
+    NullBackend     caching disabled
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Protocol
+
+from fastapi import Request, Response
+
+from app.core.config import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_URL,
+)
+from app.core.pagination import Page
+from app.core.responses import raw_json_response, type_adapter
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None: ...
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int: ...
+
+    def clear(self) -> None: ...
+
+
+class NullBackend:
+    def get(self, key: str) -> bytes | None:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None:
+        pass
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryBackend:
+    """LRU of at most max_entries values, each expiring after its TTL."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (expires_at, value, tags)
+        self._entries: OrderedDict[str, tuple[float, bytes, frozenset[str]]] = OrderedDict()
+        self._by_tag: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None:
+        tags = frozenset(tags)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set().union(*(self._by_tag.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+
+class RedisBackend:
+    """
+    Values are plain keys with an expiry; each tag is a set of the keys
+    carrying it. Works with any client exposing the redis-py commands used
+    here (get, set, sadd, expire with nx/gt, smembers, delete, scan_iter,
+    pipeline); scripts/check_response_cache.py exercises it on a fake server.
+    The "v2" in the key prefix is the entry format (header line + body).
+    """
+
+    def __init__(self, client, prefix: str = "cececo:cache:v2:"):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}k:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}t:{tag}"
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(self._key(key))
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None:
+        full_key = self._key(key)
+        seconds = max(1, int(ttl))
+        pipe = self.client.pipeline()
+        pipe.set(full_key, value, ex=seconds)
+        for tag in tags:
+            pipe.sadd(self._tag(tag), full_key)
+            # The tag set must outlive every entry it points to: give a new
+            # set this entry's TTL, and only ever extend an existing one
+            # (NX/GT, Redis 7+), or invalidate_tags loses longer-lived keys
+            pipe.expire(self._tag(tag), seconds, nx=True)
+            pipe.expire(self._tag(tag), seconds, gt=True)
+        pipe.execute()
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag(tag) for tag in tags]
+        keys = set()
+        for tag_key in tag_keys:
+            keys.update(self.client.smembers(tag_key))
+        if keys or tag_keys:
+            self.client.delete(*keys, *tag_keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_backend(url: str) -> CacheBackend:
+    """"memory" (default), "off", or a redis:// / rediss:// URL (needs the redis package)."""
+    if not url or url == "memory":
+        return MemoryBackend()
+    if url == "off":
+        return NullBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_URL is a Redis URL but the redis package is not installed") from e
+        return RedisBackend(redis.Redis.from_url(url))
+    raise RuntimeError(f"Unsupported RESPONSE_CACHE_URL '{url}'")
+
+
+def _pack(body: bytes, headers: dict[str, str]) -> bytes:
+    # Header line, then the body (compact JSON never contains a raw newline)
+    return json.dumps(headers, separators=(",", ":")).encode() + b"\n" + body
+
+
+def _unpack(value: bytes) -> tuple[bytes, dict[str, str]]:
+    head, _, body = value.partition(b"\n")
+    return body, json.loads(head)
+
+
+def entity_tags(entity: str, country_id: int | None = None) -> list[str]:
+    """Tags for a response of `entity`, filtered to country_id or unfiltered (None)."""
+    scope = f"{entity}:country:{country_id}" if country_id is not None else f"{entity}:all"
+    return [entity, scope]
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def key(request: Request) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        key = f"{request.url.path}?{query}"
+        # Set by conditional_get: the versions the route's ETag was derived from
+        versions = getattr(request.state, "table_versions", None)
+        if versions:
+            key += "#" + ",".join(f"{table}:{version}" for table, (version, _) in sorted(versions.items()))
+        return key
+
+    def _store(
+        self, request: Request, data: Any, tags: Iterable[str], model: Any, ttl: float | None
+    ) -> tuple[bytes, dict[str, str]]:
+        headers = {}
+        if isinstance(data, Page):
+            headers, data = data.headers, data.items
+        adapter = type_adapter(model)
+        # Validate like FastAPI's response_model does (ORM objects -> schema)
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        self.backend.set(self.key(request), _pack(body, headers), self.ttl if ttl is None else ttl, tags)
+        return body, headers
+
+    def _load(self, request: Request) -> tuple[bytes, dict[str, str]] | None:
+        value = self.backend.get(self.key(request))
+        return None if value is None else _unpack(value)
+
+    @staticmethod
+    def _respond(response: Response, body: bytes, headers: dict[str, str]) -> Response:
+        response.headers.update(headers)
+        return raw_json_response(response, body)
+
+    def serve(
+        self,
+        request: Request,
+        response: Response,
+        *,
+        tags: Iterable[str],
+        build: Callable[[], Any],
+        model: Any = Any,
+        ttl: float | None = None,
+    ) -> Response:
+        """
+        Return the cached body for this request, or build it, serialize it as
+        `model` (the route's response_model) and cache it under `tags`.
+        build may return a pagination.Page: its items are the body and its
+        headers (X-Next-Cursor) are cached and replayed with it.
+        """
+        cached = self._load(request)
+        if cached is None:
+            cached = self._store(request, build(), tags, model, ttl)
+        return self._respond(response, *cached)
+
+    async def serve_async(
+        self,
+        request: Request,
+        response: Response,
+        *,
+        tags: Iterable[str],
+        build: Callable[[], Awaitable[Any]],
+        model: Any = Any,
+        ttl: float | None = None,
+    ) -> Response:
+        """serve() for async routes: build is awaited on a cache miss."""
+        cached = self._load(request)
+        if cached is None:
+            cached = self._store(request, await build(), tags, model, ttl)
+        return self._respond(response, *cached)
+
+    def invalidate(self, *tags: str) -> int:
+        return self.backend.invalidate_tags(tags)
+
+    def invalidate_entity(self, entity: str, *country_ids: int | None) -> int:
+        """
+        Evict the responses an item of `entity` in these countries can appear
+        in: the lists filtered to one of the countries and the unfiltered ones.
+        """
+        tags = {f"{entity}:all"}
+        tags.update(f"{entity}:country:{cid}" for cid in country_ids if cid is not None)
+        return self.backend.invalidate_tags(tags)
+
+
+response_cache = ResponseCache(create_backend(RESPONSE_CACHE_URL))
@@ -0,0 +1,65 @@
+"""
+JSON responses rendered without jsonable_encoder.
+
+FastJSONResponse is the app's default response class: orjson renders the
+content (datetimes as ISO 8601 with "Z" for UTC, like pydantic does). Hot
+routes skip FastAPI's encode-and-validate pass entirely by returning:
+
+    json_response(response, rows)            plain dicts/lists, via orjson
+    model_response(response, items, model)   schema instances, via pydantic's
+                                             Rust serializer (dump_json)
+
+Both carry over headers already set on the injected `response` (ETag,
+Cache-Control from conditional_get), which FastAPI only merges into the
+responses it builds itself.
+"""
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+def type_adapter(model: Any) -> TypeAdapter:
+    """Cached TypeAdapter (building one compiles a validator and serializer)."""
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+def _headers(response: Response | None) -> dict[str, str]:
+    if response is None:
+        return {}
+    return {k: v for k, v in response.headers.items() if k != "content-length"}
+
+
+def raw_json_response(response: Response | None, body: bytes, status_code: int = 200) -> Response:
+    """An already serialized JSON body, with the headers set on `response`."""
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=_headers(response))
+
+
+def json_response(response: Response | None, content: Any, status_code: int = 200) -> Response:
+    return raw_json_response(response, orjson.dumps(content, option=ORJSON_OPTIONS), status_code)
+
+
+def model_response(response: Response | None, data: Any, model: Any) -> Response:
+    """
+    Serialize data as `model` (the route's response_model). Instances of the
+    schema pass through validation as is, so prebuilt (model_construct)
+    items are not validated again.
+    """
+    adapter = type_adapter(model)
+    return raw_json_response(response, adapter.dump_json(adapter.validate_python(data, from_attributes=True)))
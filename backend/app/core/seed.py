@@ -15,6 +15,7 @@ from app.models.country_target import CountryTarget
 from datetime import datetime, timezone, timedelta
 from app.models.news_item import NewsItem
 from app.models.resource import Resource
+from app.services.match_cache import rebuild_all_matches
 
 
 SEED_COUNTRIES = [
@@ -478,6 +479,7 @@ def seed_initial_data() -> None:
             db.commit()
 
         # 2) Projects/Startups: seed missing (idempotent)
+        directory_changed = False
         existing_projects = set(
             db.query(Project.kind, Project.country_id, Project.title).all()
         )
@@ -508,6 +510,7 @@ def seed_initial_data() -> None:
 
         if added:
             db.commit()
+            directory_changed = True
 
 
         # 3) Investors: seed missing (idempotent)
@@ -538,6 +541,7 @@ def seed_initial_data() -> None:
 
         if added:
             db.commit()
+            directory_changed = True
 
         # 4) Investor ↔ Country assignment (only if empty for that investor)
         investors = db.query(Investor).options(selectinload(Investor.countries)).all()
@@ -558,6 +562,11 @@ def seed_initial_data() -> None:
 
         if changed:
             db.commit()
+            directory_changed = True
+
+        # 5) Stored match scores are stale once projects/investors changed
+        if directory_changed:
+            rebuild_all_matches(db)
 
     finally:
         db.close()
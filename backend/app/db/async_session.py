@@ -0,0 +1,66 @@
+"""
+Async engine and AsyncSession dependency for the read-heavy async routes.
+
+The engine is created on first use, so processes that only use the sync
+SessionLocal (scripts, ingest workers) never open an async pool. The URL
+is ASYNC_DATABASE_URL or DATABASE_URL mapped to an async driver:
+psycopg 3 serves both modes, SQLite goes through aiosqlite.
+"""
+from typing import AsyncIterator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import ASYNC_DATABASE_URL
+from app.db.pool import engine_options, register_engine, unregister_engine
+from app.db.session import DATABASE_URL
+
+
+# Sync driver -> async driver for the same database
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _engine, _sessionmaker
+    if _engine is None:
+        url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+        _engine = create_async_engine(url, **engine_options(url, is_async=True))
+        register_engine("async", _engine.sync_engine)
+        # expire_on_commit=False: attributes stay readable after commit
+        # without an (implicit, unsupported) lazy refresh
+        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False, autoflush=False)
+    return _engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    get_async_engine()
+    return _sessionmaker()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+        unregister_engine("async")
+        _engine = _sessionmaker = None
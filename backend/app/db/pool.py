@@ -0,0 +1,155 @@
+"""
+Connection pool configuration and checkout metrics.
+
+engine_options() turns the DB_POOL_* / DB_PGBOUNCER settings into
+create_engine / create_async_engine keyword arguments for both engines.
+Their pools time every checkout, so the admin metrics endpoint can report
+how long requests wait for a connection and how close the pool is to
+saturation (waits that reach DB_POOL_TIMEOUT_SECONDS fail with
+sqlalchemy.exc.TimeoutError and are counted as timeouts).
+"""
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import (
+    DB_MAX_OVERFLOW,
+    DB_PGBOUNCER,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+)
+
+
+class PoolMetrics:
+    """Checkout wait times (recent window) and totals for one pool."""
+
+    def __init__(self, history: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.recent: deque[float] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            self.recent.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            waits = sorted(self.recent)
+            attempts = self.checkouts + self.timeouts
+            total = self.total_wait_seconds
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(total / attempts * 1000, 3) if attempts else None,
+                "p95_wait_ms": round(waits[int(len(waits) * 0.95) - 1] * 1000, 3) if len(waits) >= 20 else None,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+class _TimedCheckout:
+    """Pool mixin recording how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return conn
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def engine_options(url: str, *, is_async: bool = False) -> dict[str, Any]:
+    """Pool keyword arguments for create_engine / create_async_engine on this URL."""
+    if _is_memory_sqlite(url):
+        # One connection per thread is the only thing that works for :memory:
+        return {}
+
+    options: dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING}
+    if DB_PGBOUNCER:
+        # Transaction pooling hands each transaction a different server
+        # connection, so prepared statements and session state can't be kept
+        # (SET LOCAL, used for statement timeouts, is transaction-scoped and fine)
+        options["poolclass"] = NullPool
+        if make_url(url).get_backend_name() == "postgresql":
+            options["connect_args"] = {"prepare_threshold": None}
+        return options
+
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    )
+    return options
+
+
+_engines: dict[str, Engine] = {}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    """Report this engine's pool in pool_status() (async engines: pass .sync_engine)."""
+    _engines[name] = engine
+
+
+def unregister_engine(name: str) -> None:
+    _engines.pop(name, None)
+
+
+def _pool_status(pool: Pool) -> dict[str, Any]:
+    status: dict[str, Any] = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(0, pool._max_overflow)
+        checked_out = pool.checkedout()
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_in=pool.checkedin(),
+            checked_out=checked_out,
+            overflow=max(0, pool.overflow()),
+            saturation=round(checked_out / capacity, 3) if capacity > 0 else None,
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status["wait"] = metrics.snapshot()
+    return status
+
+
+def pool_status() -> dict[str, dict[str, Any]]:
+    """Current size, usage and checkout waits of every registered engine's pool."""
+    return {name: _pool_status(engine.pool) for name, engine in _engines.items()}
@@ -0,0 +1,30 @@
+"""
+Column projections for the list endpoints.
+
+List routes select only the columns their *Out schema serializes and read
+them as plain rows instead of hydrating ORM entities: no identity map, no
+attribute instrumentation, no relationship loaders. Rows become schema
+instances with model_construct, so values that come straight from typed
+columns are not validated a second time.
+"""
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+from sqlalchemy import Label
+from sqlalchemy.engine import Row
+
+
+def schema_columns(model: Any, schema: type[BaseModel], *, prefix: str = "") -> list[Label]:
+    """The model's table columns named like the schema's fields, labeled prefix + name."""
+    columns = model.__table__.c
+    return [columns[name].label(prefix + name) for name in schema.model_fields if name in columns]
+
+
+def pop_prefixed(values: dict[str, Any], prefix: str) -> dict[str, Any]:
+    """Remove the prefix-labeled entries from values and return them unprefixed."""
+    keys = [key for key in values if key.startswith(prefix)]
+    return {key[len(prefix):]: values.pop(key) for key in keys}
+
+
+def construct_all(schema: type[BaseModel], rows: Iterable[Row]) -> list[BaseModel]:
+    return [schema.model_construct(**row._asdict()) for row in rows]
@@ -0,0 +1,82 @@
+"""
+Query and row budgets for code paths that must stay cheap.
+
+    with query_budget(max_queries=2, max_rows=100, label="GET /countries"):
+        client.get("/api/v1/countries")
+
+counts every SQL statement executed on any engine (sync or async) and
+every ORM entity loaded while the block runs, and raises QueryBudgetExceeded
+(an AssertionError) listing the statements if either limit is passed. A
+relationship that silently turns eager again, or a loop that lazy-loads
+per row, shows up as an exceeded budget instead of a slow page.
+
+Counting is process-wide, so run budgets one at a time (scripts/
+check_query_budgets.py checks every hot endpoint this way).
+"""
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.db.base import Base
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class QueryStats:
+    statements: list[str] = field(default_factory=list)
+    rows: int = 0  # ORM entities loaded
+
+    @property
+    def queries(self) -> int:
+        return len(self.statements)
+
+
+_lock = threading.Lock()
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Record the statements run and entities loaded inside the block."""
+    stats = QueryStats()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        with _lock:
+            stats.statements.append(" ".join(statement.split()))
+
+    def on_load(target, context):
+        with _lock:
+            stats.rows += 1
+
+    event.listen(Engine, "before_cursor_execute", on_execute)
+    event.listen(Base, "load", on_load, propagate=True)
+    try:
+        yield stats
+    finally:
+        event.remove(Engine, "before_cursor_execute", on_execute)
+        event.remove(Base, "load", on_load)
+
+
+@contextmanager
+def query_budget(
+    *, max_queries: int, max_rows: int | None = None, label: str = ""
+) -> Iterator[QueryStats]:
+    """count_queries() that fails when the block runs more than max_queries
+    statements or loads more than max_rows entities."""
+    with count_queries() as stats:
+        yield stats
+
+    problems = []
+    if stats.queries > max_queries:
+        problems.append(f"{stats.queries} queries (budget {max_queries})")
+    if max_rows is not None and stats.rows > max_rows:
+        problems.append(f"{stats.rows} rows loaded (budget {max_rows})")
+    if problems:
+        listing = "\n".join(f"  {i + 1}. {sql[:200]}" for i, sql in enumerate(stats.statements))
+        raise QueryBudgetExceeded(f"{label or 'block'}: {', '.join(problems)}\n{listing}")
@@ -0,0 +1,73 @@
+"""
+Per-route statement timeouts.
+
+    @router.get("", dependencies=[Depends(statement_timeout(5000))])
+
+runs SET LOCAL statement_timeout on the request's session before the route
+queries, so a runaway query (e.g. a slow ILIKE search) is cancelled by
+Postgres instead of holding its pooled connection. SET LOCAL only lasts
+until the transaction ends, so the setting never leaks to the next user
+of the connection, and it works behind PgBouncer in transaction mode. A
+cancelled query becomes a 503. Other databases have no statement
+timeout; the dependency does nothing there.
+"""
+from fastapi import Depends, HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.async_session import get_async_db
+from app.db.session import get_db
+
+
+QUERY_CANCELED = "57014"  # SQLSTATE of statement_timeout cancellations
+
+
+def _set_local_sql(dialect: str, ms: int):
+    if ms <= 0 or dialect != "postgresql":
+        return None
+    # SET does not take bind parameters; ms is an int
+    return text(f"SET LOCAL statement_timeout = {int(ms)}")
+
+
+def is_statement_timeout(error: OperationalError) -> bool:
+    return getattr(error.orig, "sqlstate", None) == QUERY_CANCELED
+
+
+def _timed_out() -> HTTPException:
+    return HTTPException(status_code=503, detail="Query took too long; try a narrower filter")
+
+
+def statement_timeout(ms: int):
+    """Dependency factory: cap every statement of the request (sync session) at ms."""
+
+    def dependency(db: Session = Depends(get_db)):
+        stmt = _set_local_sql(db.get_bind().dialect.name, ms)
+        if stmt is not None:
+            db.execute(stmt)
+        try:
+            yield
+        except OperationalError as e:
+            if is_statement_timeout(e):
+                raise _timed_out() from e
+            raise
+
+    return dependency
+
+
+def statement_timeout_async(ms: int):
+    """statement_timeout for routes on the AsyncSession."""
+
+    async def dependency(db: AsyncSession = Depends(get_async_db)):
+        stmt = _set_local_sql(db.get_bind().dialect.name, ms)
+        if stmt is not None:
+            await db.execute(stmt)
+        try:
+            yield
+        except OperationalError as e:
+            if is_statement_timeout(e):
+                raise _timed_out() from e
+            raise
+
+    return dependency
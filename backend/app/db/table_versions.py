@@ -0,0 +1,75 @@
+"""
+Per-table change counters used as HTTP cache validators.
+
+Every ORM flush bumps table_versions for the tables of the objects it
+inserted, updated or deleted, in the same transaction as the change, so a
+version is visible exactly when the data is. Core statements (bulk
+inserts, bulk deletes) do not go through the flush and must call
+bump_table_versions themselves.
+
+Writes made outside the application (psql, other services) are not seen;
+bump the rows by hand after such changes.
+"""
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.table_version import TableVersion
+
+
+def _upsert(dialect: str):
+    if dialect == "postgresql":
+        return postgresql.insert(TableVersion)
+    if dialect == "sqlite":
+        return sqlite.insert(TableVersion)
+    raise RuntimeError(f"Table versions are not supported on dialect '{dialect}'")
+
+
+def bump_table_versions(db: Session, tables: Iterable[str]) -> None:
+    """Increment the version of each table inside the session's current transaction."""
+    tables = sorted(set(tables))  # fixed order, so concurrent bumps don't deadlock
+    if not tables:
+        return
+    conn = db.connection()
+    stmt = _upsert(conn.dialect.name)
+    stmt = stmt.values([{"table_name": t, "version": 1} for t in tables]).on_conflict_do_update(
+        index_elements=["table_name"],
+        set_={"version": TableVersion.version + 1, "updated_at": func.now()},
+    )
+    conn.execute(stmt)
+
+
+def get_table_versions(db: Session, tables: Iterable[str]) -> dict[str, tuple[int, datetime | None]]:
+    """(version, updated_at) per table; tables never written report (0, None)."""
+    tables = list(tables)
+    rows = db.execute(
+        select(TableVersion.table_name, TableVersion.version, TableVersion.updated_at).where(
+            TableVersion.table_name.in_(tables)
+        )
+    ).all()
+    found = {name: (version, updated_at) for name, version, updated_at in rows}
+    return {t: found.get(t, (0, None)) for t in tables}
+
+
+def _changed_tables(session: Session) -> set[str]:
+    changed = {obj.__table__.name for obj in session.new}
+    changed.update(obj.__table__.name for obj in session.deleted)
+    # dirty also lists objects whose attributes were set to the same value
+    changed.update(
+        obj.__table__.name for obj in session.dirty if session.is_modified(obj)
+    )
+    changed.discard(TableVersion.__tablename__)
+    return changed
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe what this flush wrote
+    bump_table_versions(session, _changed_tables(session))
+
+
+def track_table_versions(session_factory: sessionmaker) -> None:
+    """Bump table versions on every flush of sessions made by this factory."""
+    event.listen(session_factory, "after_flush", _after_flush)
@@ -1,19 +1,35 @@
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router as api_router
 from app.db.base import Base
+from app.db.async_session import dispose_async_engine
 from app.db.session import engine
 from app.core.seed import seed_initial_data
+from app.core.http_cache import NotModified
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
+from app.core.config import (
+    GDELT_INGEST_AUTO_APPROVE,
+    GDELT_INGEST_INTERVAL_MINUTES,
+    GDELT_INGEST_TIMESPAN,
+)
+from app.services.gdelt import close_gdelt_client
+from app.services.ingest_jobs import IngestParams, ingest_jobs, run_ingest_scheduler
 from app.models.country_policy import CountryPolicy  # noqa: F401
 from app.models.country_framework import CountryFramework  # noqa: F401
 from app.models.country_indicator import CountryIndicator  # noqa: F401
 from app.models.country_institution import CountryInstitution  # noqa: F401
 from app.models.country_target import CountryTarget  # noqa: F401
 from app.models.news_item import NewsItem  # noqa: F401
+from app.models.news_ingest_watermark import NewsIngestWatermark  # noqa: F401
 from app.models.resource import Resource  # noqa: F401
+from app.models.project_investor_match import ProjectInvestorMatch  # noqa: F401
+from app.models.table_version import TableVersion  # noqa: F401
 
-app = FastAPI(title="CECECO Hub MVP")
+app = FastAPI(title="CECECO Hub MVP", default_response_class=FastJSONResponse)
 
 # CORS for Next.js dev + (optional) Swagger try-it-out from same origin
 app.add_middleware(
@@ -26,8 +42,15 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers read the keyset pagination cursor of the listing endpoints
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(status_code=304, headers=exc.headers)
+
+
 @app.on_event("startup")
 def on_startup() -> None:
     """
@@ -38,6 +61,33 @@ def on_startup() -> None:
     Base.metadata.create_all(bind=engine)
     seed_initial_data()
 
+
+_scheduler_task: asyncio.Task | None = None
+
+
+@app.on_event("startup")
+async def start_ingest_scheduler() -> None:
+    """Periodic incremental GDELT ingest (enabled by GDELT_INGEST_INTERVAL_MINUTES)."""
+    global _scheduler_task
+    if GDELT_INGEST_INTERVAL_MINUTES > 0:
+        params = IngestParams(
+            timespan=GDELT_INGEST_TIMESPAN,
+            auto_approve=GDELT_INGEST_AUTO_APPROVE,
+        )
+        _scheduler_task = asyncio.create_task(
+            run_ingest_scheduler(GDELT_INGEST_INTERVAL_MINUTES * 60, params)
+        )
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    if _scheduler_task:
+        _scheduler_task.cancel()
+    ingest_jobs.cancel_all()
+    # Release the pooled GDELT connections
+    await close_gdelt_client()
+    await dispose_async_engine()
+
 # Health/root endpoint (prevents annoying 404 on "/")
 @app.get("/")
 def root():
@@ -17,16 +17,18 @@ class Country(Base):
     potential_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     action_plan_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Relationships load lazily; endpoints that serialize one ask for it with
+    # a loader option (selectinload/joinedload), so listing countries never
+    # drags in every investor and news item
     investors = relationship(
         "Investor",
         secondary="investor_countries",
         back_populates="countries",
-        lazy="selectin",
     )
 
-    policies = relationship("CountryPolicy", back_populates="country", lazy="selectin", cascade="all, delete-orphan")
-    frameworks = relationship("CountryFramework", back_populates="country", lazy="selectin", cascade="all, delete-orphan")
-    indicators = relationship("CountryIndicator", back_populates="country", lazy="selectin", cascade="all, delete-orphan")
-    news_items = relationship("NewsItem", back_populates="country", lazy="selectin")
+    policies = relationship("CountryPolicy", back_populates="country", cascade="all, delete-orphan")
+    frameworks = relationship("CountryFramework", back_populates="country", cascade="all, delete-orphan")
+    indicators = relationship("CountryIndicator", back_populates="country", cascade="all, delete-orphan")
+    news_items = relationship("NewsItem", back_populates="country")
     institutions = relationship("CountryInstitution", back_populates="country", cascade="all, delete-orphan")
     targets = relationship("CountryTarget", back_populates="country", cascade="all, delete-orphan")
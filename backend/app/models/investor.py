@@ -33,5 +33,4 @@ class Investor(Base):
         "Country",
         secondary=investor_countries,
         back_populates="investors",
-        lazy="selectin",
     )
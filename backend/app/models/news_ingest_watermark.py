@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class NewsIngestWatermark(Base):
+    """Newest GDELT seendate stored per ingest scope, for incremental fetching."""
+
+    __tablename__ = "news_ingest_watermarks"
+
+    # Country ISO2 for sourcecountry-filtered fetches, "GLOBAL" for the unfiltered one
+    scope: Mapped[str] = mapped_column(String(10), primary_key=True)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -38,5 +38,32 @@ class NewsItem(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
-    country = relationship("Country", back_populates="news_items", lazy="selectin")
+    country = relationship("Country", back_populates="news_items")
 
+
+# Feed indexes (see alembic revision d4e5f6a7b8c9): partial on status so the
+# approved feed and the moderation queue each read an index in sort order
+_APPROVED = NewsItem.status == "approved"
+_PENDING = NewsItem.status == "pending"
+
+Index(
+    "ix_news_items_approved_published",
+    NewsItem.published_at.desc(),
+    NewsItem.id.desc(),
+    postgresql_where=_APPROVED,
+    sqlite_where=_APPROVED,
+)
+Index(
+    "ix_news_items_approved_country_published",
+    NewsItem.country_id,
+    NewsItem.published_at.desc(),
+    NewsItem.id.desc(),
+    postgresql_where=_APPROVED,
+    sqlite_where=_APPROVED,
+)
+Index(
+    "ix_news_items_pending_published",
+    NewsItem.published_at.desc(),
+    postgresql_where=_PENDING,
+    sqlite_where=_PENDING,
+)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,7 +15,7 @@ class Project(Base):
     kind: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
 
     country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"), nullable=False, index=True)
-    country = relationship("Country", lazy="joined")
+    country = relationship("Country")
 
     title: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
@@ -27,3 +29,6 @@ class Project(Base):
         server_default=func.now(),
         nullable=False,
     )
+    # When this project's project_investor_matches rows were last computed
+    # (NULL: never; they are then computed on the first matches read)
+    matches_computed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
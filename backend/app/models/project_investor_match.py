@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ProjectInvestorMatch(Base):
+    """
+    Persisted output of matching.score_investor_for_project for one
+    project/investor pair, refreshed when either side is created.
+    """
+
+    __tablename__ = "project_investor_matches"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    investor_id: Mapped[int] = mapped_column(
+        ForeignKey("investors.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    score: Mapped[int] = mapped_column(Integer, nullable=False)  # legacy 0..5
+    score_100: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Lets strict_country filter in SQL
+    country_match: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+    score_breakdown: Mapped[dict] = mapped_column(JSON, nullable=False)
+    reasons: Mapped[list] = mapped_column(JSON, nullable=False)
+    reason_points: Mapped[list] = mapped_column(JSON, nullable=False)
+    why: Mapped[str] = mapped_column(Text, nullable=False)
+
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        # GET /projects/{id}/matches: WHERE project_id = ? ORDER BY score_100 DESC, investor_id DESC
+        Index(
+            "ix_project_investor_matches_rank",
+            "project_id",
+            score_100.desc(),
+            investor_id.desc(),
+        ),
+        Index("ix_project_investor_matches_investor_id", "investor_id"),
+    )
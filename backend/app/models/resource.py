@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -35,4 +35,8 @@ class Resource(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
-    country = relationship("Country", lazy="selectin")
+    country = relationship("Country")
+
+
+# Library listing / search: WHERE status = ? [AND country_id = ?] ORDER BY submitted_at DESC
+Index("ix_resources_status_submitted", Resource.status, Resource.submitted_at.desc())
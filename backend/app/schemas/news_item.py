@@ -27,6 +27,15 @@ class NewsItemOut(BaseModel):
         from_attributes = True
 
 
+class NewsPageOut(BaseModel):
+    items: list[NewsItemOut]
+    total: int | None = None
+    limit: int
+    offset: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
 class NewsItemCreate(BaseModel):
     country_id: int | None = None
     status: str | None = None
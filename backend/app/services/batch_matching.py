@@ -0,0 +1,232 @@
+"""
+Vectorized project x investor matching for bulk views and precomputation.
+
+Each investor attribute (country, sector, stage) is one-hot encoded as a
+boolean matrix with one row per known value and one column per investor,
+plus a trailing all-False row for "value missing / unknown". A project
+selects one row per attribute, so gathering the rows for a block of
+projects yields the (projects x investors) hit matrices in one step, and
+
+    score_100 = 40 * country_hit + 40 * sector_hit + 20 * stage_hit
+
+is plain array arithmetic. Top-K per row uses argpartition on a key that
+packs (score_100, id) into one integer, which reproduces the
+(score desc, id desc) order of matching.build_matches. Explanations are
+built with matching._explain for the selected pairs only, so every entry is
+identical to what score_investor_for_project would produce.
+"""
+from __future__ import annotations
+
+import weakref
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.models.project import Project
+from app.services.investor_index import InvestorIndex
+from app.services.matching import _explain, _match_entry
+
+
+ROW_BLOCK = 1024  # projects scored per block; bounds the dense matrices in memory
+
+
+def _one_hot(value_sets: list[Iterable], vocabulary: dict) -> np.ndarray:
+    # (len(vocabulary) + 1, len(value_sets)); the last row stays all False
+    matrix = np.zeros((len(vocabulary) + 1, len(value_sets)), dtype=bool)
+    for col, values in enumerate(value_sets):
+        for value in values:
+            matrix[vocabulary[value], col] = True
+    return matrix
+
+
+def _vocabulary(value_sets: list[Iterable]) -> dict:
+    vocabulary: dict = {}
+    for values in value_sets:
+        for value in values:
+            vocabulary.setdefault(value, len(vocabulary))
+    return vocabulary
+
+
+def _top_k_desc(keys: np.ndarray, k: int) -> list[np.ndarray]:
+    """Per row, the column indices of the k largest non-negative keys, largest first."""
+    n_cols = keys.shape[1]
+    if k < n_cols:
+        part = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(n_cols), keys.shape)
+    part_keys = np.take_along_axis(keys, part, axis=1)
+    order = np.argsort(-part_keys, axis=1, kind="stable")
+    top = np.take_along_axis(part, order, axis=1)
+    top_keys = np.take_along_axis(part_keys, order, axis=1)
+    # Negative keys mark pairs excluded by strict_country
+    return [row[row_keys >= 0] for row, row_keys in zip(top, top_keys)]
+
+
+class BatchMatcher:
+    """
+    Scores many projects against every investor of an InvestorIndex.
+
+    Investors are laid out in ascending id order, so a column index doubles
+    as the id tie-breaker.
+    """
+
+    def __init__(self, index: InvestorIndex):
+        self.index = index
+        self.investors = [index.investors[inv_id] for inv_id in sorted(index.investors)]
+
+        country_sets = [inv.country_ids for inv in self.investors]
+        sector_sets = [inv.sector_set for inv in self.investors]
+        stage_sets = [inv.stage_set for inv in self.investors]
+
+        self.country_vocab = _vocabulary(country_sets)
+        self.sector_vocab = _vocabulary(sector_sets)
+        self.stage_vocab = _vocabulary(stage_sets)
+
+        self.countries = _one_hot(country_sets, self.country_vocab)
+        self.sectors = _one_hot(sector_sets, self.sector_vocab)
+        self.stages = _one_hot(stage_sets, self.stage_vocab)
+
+    def _encode(self, projects: list[Project]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Row index per project; unknown values map to the all-False row
+        def rows(vocabulary: dict, values: list) -> np.ndarray:
+            missing = len(vocabulary)
+            return np.fromiter(
+                (vocabulary.get(v, missing) for v in values), dtype=np.intp, count=len(values)
+            )
+
+        return (
+            rows(self.country_vocab, [p.country_id for p in projects]),
+            rows(self.sector_vocab, [(p.sector or "").strip().lower() for p in projects]),
+            rows(self.stage_vocab, [(p.stage or "").strip().lower() for p in projects]),
+        )
+
+    def hits(self, projects: list[Project]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Boolean (projects x investors) country, sector and stage hit matrices."""
+        country_rows, sector_rows, stage_rows = self._encode(projects)
+        return self.countries[country_rows], self.sectors[sector_rows], self.stages[stage_rows]
+
+    @staticmethod
+    def scores(country: np.ndarray, sector: np.ndarray, stage: np.ndarray) -> np.ndarray:
+        """score_100 matrix; must agree with the breakdown buckets in matching._explain."""
+        return 40 * country.astype(np.int64) + 40 * sector + 20 * stage
+
+    def _keys(
+        self,
+        projects: list[Project],
+        order_weight: int,
+        tiebreak: np.ndarray,
+        strict_country: bool,
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        country, sector, stage = self.hits(projects)
+        keys = self.scores(country, sector, stage) * order_weight + tiebreak
+        if strict_country:
+            has_country = np.array([bool(p.country_id) for p in projects])
+            keys[has_country[:, None] & ~country] = -1
+        return keys, (country, sector, stage)
+
+    def top_investors(
+        self,
+        projects: list[Project],
+        *,
+        limit: int,
+        strict_country: bool = False,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Best `limit` investors per project, keyed by project id. Entries are
+        the same dicts as matching.build_matches (with InvestorFeatures).
+        """
+        limit = max(1, limit)
+        n_inv = len(self.investors)
+        result: dict[int, list[dict[str, Any]]] = {p.id: [] for p in projects}
+        if not n_inv:
+            return result
+
+        tiebreak = np.arange(n_inv)[None, :]
+        for start in range(0, len(projects), ROW_BLOCK):
+            block = projects[start:start + ROW_BLOCK]
+            keys, (country, sector, stage) = self._keys(block, n_inv, tiebreak, strict_country)
+            for row, (project, cols) in enumerate(zip(block, _top_k_desc(keys, limit))):
+                result[project.id] = [
+                    _match_entry(
+                        self.investors[col],
+                        _explain(
+                            project,
+                            country_hit=bool(country[row, col]),
+                            sector_hit=bool(sector[row, col]),
+                            stage_hit=bool(stage[row, col]),
+                        ),
+                    )
+                    for col in cols
+                ]
+        return result
+
+    def top_projects(
+        self,
+        projects: list[Project],
+        *,
+        limit: int,
+        strict_country: bool = False,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Best `limit` projects per investor, keyed by investor id, ordered by
+        score then project id (both descending). Entries hold the project
+        under "project" and the same score fields as build_matches.
+        """
+        limit = max(1, limit)
+        projects = sorted(projects, key=lambda p: p.id)
+        n_proj = len(projects)
+        result: dict[int, list[dict[str, Any]]] = {inv.id: [] for inv in self.investors}
+        if not n_proj or not self.investors:
+            return result
+
+        # Keep each block's top `limit` per investor, then pick the final top
+        # from those candidates
+        cand_keys, cand_rows, cand_hits = [], [], []
+        for start in range(0, n_proj, ROW_BLOCK):
+            block = projects[start:start + ROW_BLOCK]
+            tiebreak = np.arange(start, start + len(block))[:, None]
+            keys, (country, sector, stage) = self._keys(block, n_proj, tiebreak, strict_country)
+            k = min(limit, len(block))
+            rows = np.argpartition(-keys, k - 1, axis=0)[:k] if k < len(block) else (
+                np.broadcast_to(np.arange(len(block))[:, None], keys.shape)
+            )
+            cand_keys.append(np.take_along_axis(keys, rows, axis=0))
+            cand_rows.append(rows + start)
+            cand_hits.append(
+                np.stack([np.take_along_axis(m, rows, axis=0) for m in (country, sector, stage)])
+            )
+
+        keys = np.concatenate(cand_keys, axis=0).T
+        rows = np.concatenate(cand_rows, axis=0).T
+        hits = np.concatenate(cand_hits, axis=1).transpose(0, 2, 1)
+        for col, (inv, picks) in enumerate(zip(self.investors, _top_k_desc(keys, limit))):
+            result[inv.id] = [
+                self._project_entry(projects[rows[col, pick]], hits[:, col, pick])
+                for pick in picks
+            ]
+        return result
+
+    @staticmethod
+    def _project_entry(project: Project, hit: np.ndarray) -> dict[str, Any]:
+        entry = _match_entry(
+            project,
+            _explain(
+                project,
+                country_hit=bool(hit[0]),
+                sector_hit=bool(hit[1]),
+                stage_hit=bool(hit[2]),
+            ),
+        )
+        entry["project"] = entry.pop("investor")
+        return entry
+
+
+_matchers: weakref.WeakKeyDictionary[InvestorIndex, BatchMatcher] = weakref.WeakKeyDictionary()
+
+
+def get_batch_matcher(index: InvestorIndex) -> BatchMatcher:
+    """BatchMatcher for an investor index, built once per index instance."""
+    matcher = _matchers.get(index)
+    if matcher is None:
+        matcher = _matchers[index] = BatchMatcher(index)
+    return matcher
@@ -1,9 +1,140 @@
 """
 Country matching for GDELT articles during ingestion.
 Matches by ISO2 code, known name variations, and fuzzy matching in content.
+
+CountryMatcher builds the lookup tables and a single combined regex once per
+ingest; match_country_from_gdelt is kept as a one-shot wrapper around it.
 """
 
 import re
+from typing import Iterable
+
+
+MatchResult = tuple[int | None, str | None, str | None]
+
+GLOBAL_MATCH: MatchResult = (None, "Global", None)
+
+# Extra name variants per country (on top of the upper-cased country name)
+COUNTRY_NAME_VARIANTS: dict[str, list[str]] = {
+    "Türkiye": ["TURKEY", "TURKIYE", "TURKISH"],
+    "Kazakhstan": ["KAZAKH", "KAZAK"],
+    "Uzbekistan": ["UZBEK", "UZBEKISTAN"],
+    "Kyrgyzstan": ["KYRGYZ", "KYRGYZSTAN", "KYRGYZ REPUBLIC"],
+    "Pakistan": ["PAKISTANI"],
+    "Azerbaijan": ["AZERBAIJANI", "AZERI"],
+}
+
+# Country-specific TLDs checked against the article domain (in this order)
+COUNTRY_TLDS = ["AZ", "TR", "PK", "KZ", "UZ", "KG"]
+
+ISO2_FIELDS = ["countrycode", "country_code", "iso2", "iso_2"]
+
+
+class CountryMatcher:
+    """
+    Reusable matcher built once from the Country rows.
+
+    Holds O(1) ISO2 lookups, the ordered name variation table, the domain TLD
+    table and one combined regex over all name variants. Results are plain
+    (country_id, country_name, country_iso2) tuples, so the matcher does not
+    keep ORM objects alive and can be used outside the request session.
+    """
+
+    def __init__(self, all_countries: Iterable):
+        self.iso2_to_match: dict[str, MatchResult] = {}
+        # Insertion order matters: earlier variants win, as in the original loop
+        self.name_variations: dict[str, MatchResult] = {}
+
+        for c in all_countries:
+            result = (c.id, c.name, c.iso2)
+            self.iso2_to_match[c.iso2.upper()] = result
+            self.name_variations[c.name.upper()] = result
+            for variant in COUNTRY_NAME_VARIANTS.get(c.name, []):
+                self.name_variations[variant] = result
+
+        self.tld_matches: list[tuple[str, MatchResult]] = [
+            (f".{iso2}", self.iso2_to_match[iso2])
+            for iso2 in COUNTRY_TLDS
+            if iso2 in self.iso2_to_match
+        ]
+
+        # Group N of the pattern is the N-th variant. The lookahead makes the
+        # scan try every start position, and at each position the alternation
+        # picks the earliest variant, so the lowest group index over all
+        # matches is the same variant the per-variant \b...\b loop would find.
+        self._variant_results = list(self.name_variations.values())
+        if self.name_variations:
+            alternation = "|".join(
+                f"({re.escape(variant)})\\b" for variant in self.name_variations
+            )
+            self._content_re = re.compile(rf"(?=\b(?:{alternation}))", re.IGNORECASE)
+        else:
+            self._content_re = None
+
+    def _match_content(self, content: str) -> MatchResult | None:
+        if self._content_re is None:
+            return None
+        best = None
+        for m in self._content_re.finditer(content):
+            index = m.lastindex
+            if best is None or index < best:
+                best = index
+                if best == 1:
+                    break
+        if best is None:
+            return None
+        return self._variant_results[best - 1]
+
+    def match(self, gdelt_article: dict) -> MatchResult:
+        """
+        Match GDELT article to a country using multiple strategies.
+
+        Returns: (country_id, country_name, country_iso2)
+        """
+        # Strategy 1: Check sourcecountry field (primary source)
+        article_iso2 = gdelt_article.get("sourcecountry", "").strip().upper()
+        if article_iso2 and article_iso2 in self.iso2_to_match:
+            return self.iso2_to_match[article_iso2]
+
+        # Strategy 2: Check country field (if GDELT provides it)
+        article_country_name = gdelt_article.get("country", "").strip().upper()
+        if article_country_name:
+            # Direct match
+            if article_country_name in self.name_variations:
+                return self.name_variations[article_country_name]
+
+            # Partial match (e.g., "Kazakhstan" in "Republic of Kazakhstan")
+            for variant, result in self.name_variations.items():
+                if variant in article_country_name or article_country_name in variant:
+                    return result
+
+        # Strategy 3: Check other ISO2 fields that GDELT might use
+        for field in ISO2_FIELDS:
+            iso2_value = gdelt_article.get(field, "").strip().upper()
+            if iso2_value and iso2_value in self.iso2_to_match:
+                return self.iso2_to_match[iso2_value]
+
+        # Strategy 4: Fuzzy match in title and summary (case-insensitive)
+        title = gdelt_article.get("title", "").upper()
+        summary = gdelt_article.get("summary", "") or gdelt_article.get("snippet", "")
+        summary = summary.upper() if summary else ""
+        content_match = self._match_content(f"{title} {summary}")
+        if content_match:
+            return content_match
+
+        # Strategy 5: Check domain for country indicators
+        domain = gdelt_article.get("domain", "").upper()
+        if domain:
+            for tld, result in self.tld_matches:
+                if tld in domain:
+                    return result
+
+        # No match - return global
+        return GLOBAL_MATCH
+
+    def match_many(self, gdelt_articles: Iterable[dict]) -> list[MatchResult]:
+        """Match a batch of articles; results are in input order."""
+        return [self.match(article) for article in gdelt_articles]
 
 
 def match_country_from_gdelt(
@@ -12,94 +143,10 @@ def match_country_from_gdelt(
 ) -> tuple[int | None, str | None, str | None]:
     """
     Match GDELT article to a country using multiple strategies.
-    
+
+    Builds a throwaway CountryMatcher; when matching many articles, build one
+    CountryMatcher and reuse it instead.
+
     Returns: (country_id, country_name, country_iso2)
     """
-    # Build lookup maps
-    iso2_to_country = {c.iso2.upper(): c for c in all_countries}
-    
-    # Comprehensive name variations for all CECECO countries
-    name_variations = {}
-    for c in all_countries:
-        name_upper = c.name.upper()
-        name_variations[name_upper] = c
-        
-        # Handle specific variations
-        if c.name == "Türkiye":
-            name_variations["TURKEY"] = c
-            name_variations["TURKIYE"] = c
-            name_variations["TURKISH"] = c
-        elif c.name == "Kazakhstan":
-            name_variations["KAZAKH"] = c
-            name_variations["KAZAK"] = c
-        elif c.name == "Uzbekistan":
-            name_variations["UZBEK"] = c
-            name_variations["UZBEKISTAN"] = c
-        elif c.name == "Kyrgyzstan":
-            name_variations["KYRGYZ"] = c
-            name_variations["KYRGYZSTAN"] = c
-            name_variations["KYRGYZ REPUBLIC"] = c
-        elif c.name == "Pakistan":
-            name_variations["PAKISTANI"] = c
-        elif c.name == "Azerbaijan":
-            name_variations["AZERBAIJANI"] = c
-            name_variations["AZERI"] = c
-    
-    # Strategy 1: Check sourcecountry field (primary source)
-    article_iso2 = gdelt_article.get("sourcecountry", "").strip().upper()
-    if article_iso2 and article_iso2 in iso2_to_country:
-        country = iso2_to_country[article_iso2]
-        return country.id, country.name, country.iso2
-    
-    # Strategy 2: Check country field (if GDELT provides it)
-    article_country_name = gdelt_article.get("country", "").strip().upper()
-    if article_country_name:
-        # Direct match
-        if article_country_name in name_variations:
-            country = name_variations[article_country_name]
-            return country.id, country.name, country.iso2
-        
-        # Partial match (e.g., "Kazakhstan" in "Republic of Kazakhstan")
-        for variant, country in name_variations.items():
-            if variant in article_country_name or article_country_name in variant:
-                return country.id, country.name, country.iso2
-    
-    # Strategy 3: Check other ISO2 fields that GDELT might use
-    for field in ["countrycode", "country_code", "iso2", "iso_2"]:
-        iso2_value = gdelt_article.get(field, "").strip().upper()
-        if iso2_value and iso2_value in iso2_to_country:
-            country = iso2_to_country[iso2_value]
-            return country.id, country.name, country.iso2
-    
-    # Strategy 4: Fuzzy match in title and summary (case-insensitive)
-    title = gdelt_article.get("title", "").upper()
-    summary = gdelt_article.get("summary", "") or gdelt_article.get("snippet", "")
-    summary = summary.upper() if summary else ""
-    content = f"{title} {summary}"
-    
-    # Check for country names in content
-    for variant, country in name_variations.items():
-        # Use word boundaries to avoid partial matches in other words
-        pattern = r'\b' + re.escape(variant) + r'\b'
-        if re.search(pattern, content, re.IGNORECASE):
-            return country.id, country.name, country.iso2
-    
-    # Strategy 5: Check domain for country indicators
-    domain = gdelt_article.get("domain", "").upper()
-    if domain:
-        # Check for country TLDs or country-specific domains
-        country_tlds = {
-            ".AZ": iso2_to_country.get("AZ"),
-            ".TR": iso2_to_country.get("TR"),
-            ".PK": iso2_to_country.get("PK"),
-            ".KZ": iso2_to_country.get("KZ"),
-            ".UZ": iso2_to_country.get("UZ"),
-            ".KG": iso2_to_country.get("KG"),
-        }
-        for tld, country in country_tlds.items():
-            if country and tld in domain:
-                return country.id, country.name, country.iso2
-    
-    # No match - return global
-    return None, "Global", None
-
+    return CountryMatcher(all_countries).match(gdelt_article)
@@ -0,0 +1,167 @@
+"""
+Explainable country ranking with a versioned, LRU-bounded cache.
+
+Indicators only change when curated, so a ranking is computed once per
+(indicator data version, weight set) and the serialized JSON is reused
+until the data changes. The version comes from the table_versions counters
+of the countries and country_indicators tables (one primary-key lookup per
+request), which every write through the ORM bumps.
+"""
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.config import RANKING_CACHE_SIZE
+from app.core.http_cache import make_etag
+from app.db.table_versions import get_table_versions
+from app.models.country import Country
+from app.models.country_indicator import CountryIndicator
+from app.schemas.country import CountryRankOut
+
+
+# Weights must sum to 1.0
+DEFAULT_WEIGHTS: dict[str, float] = {
+    "policy_readiness": 0.30,
+    "investment_attractiveness": 0.25,
+    "renewable_proxy": 0.25,
+    "efficiency_need": 0.10,
+    "grid_proxy": 0.10,
+}
+
+WEIGHT_DECIMALS = 6
+
+
+class InvalidWeights(ValueError):
+    pass
+
+
+def normalize_weights(overrides: dict[str, float | None] | None = None) -> dict[str, float]:
+    """
+    Default weights with the given overrides applied, rescaled to sum to 1.0.
+
+    A weight of 0 leaves that indicator out. Rounding makes equivalent
+    weight sets (e.g. 2/1/1 and 0.5/0.25/0.25) share one cache entry.
+    """
+    weights = dict(DEFAULT_WEIGHTS)
+    for key, value in (overrides or {}).items():
+        if value is None:
+            continue
+        if key not in weights:
+            raise InvalidWeights(f"Unknown indicator weight '{key}'")
+        if value < 0:
+            raise InvalidWeights(f"Weight '{key}' must not be negative")
+        weights[key] = float(value)
+
+    total = sum(weights.values())
+    if total <= 0:
+        raise InvalidWeights("At least one weight must be positive")
+    return {key: round(w / total, WEIGHT_DECIMALS) for key, w in weights.items()}
+
+
+RANKING_TABLES = ("countries", "country_indicators")
+
+
+def indicator_data_version(db: Session) -> str:
+    """Version of every input of the ranking; changes whenever one of its tables is written."""
+    versions = get_table_versions(db, RANKING_TABLES)
+    return ".".join(str(version) for version, _ in versions.values())
+
+
+def compute_ranking(db: Session, weights: dict[str, float]) -> list[CountryRankOut]:
+    """
+    Explainable MVP ranking based on normalized indicators (0..1).
+    Score is normalized to 0..100.
+    """
+    countries = db.query(Country).order_by(Country.id.asc()).all()
+    if not countries:
+        return []
+
+    # Load indicators in one query
+    rows = db.query(CountryIndicator.country_id, CountryIndicator.key, CountryIndicator.value).all()
+    by_country: dict[int, dict[str, float]] = {}
+    for country_id, key, value in rows:
+        by_country.setdefault(country_id, {})[key] = value
+
+    out: list[CountryRankOut] = []
+    for c in countries:
+        ind_map = by_country.get(c.id, {})
+
+        breakdown = []
+        weighted_sum = 0.0
+        weight_used = 0.0
+
+        for key, w in weights.items():
+            value = ind_map.get(key)
+            v = float(value) if value is not None else None  # normalized 0..1
+            if v is not None:
+                weighted_sum += v * w
+                weight_used += w
+
+            breakdown.append(
+                {
+                    "key": key,
+                    "value": v,
+                    "weight": w,
+                }
+            )
+
+        # Normalize if some indicators missing
+        score01 = (weighted_sum / weight_used) if weight_used > 0 else 0.0
+        score = int(round(score01 * 100))
+
+        out.append(
+            CountryRankOut(
+                country_id=c.id,
+                name=c.name,
+                iso2=c.iso2,
+                region=c.region,
+                score=score,
+                breakdown=breakdown,
+            )
+        )
+
+    out.sort(key=lambda x: x.score, reverse=True)
+    return out
+
+
+@dataclass(frozen=True)
+class CachedRanking:
+    etag: str
+    body: bytes  # serialized JSON list of CountryRankOut
+
+
+class RankingCache:
+    """LRU of serialized rankings keyed by (data version, weights)."""
+
+    def __init__(self, max_entries: int = RANKING_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CachedRanking] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, weights: dict[str, float]) -> CachedRanking:
+        version = indicator_data_version(db)
+        key = (version, tuple(sorted(weights.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        ranking = compute_ranking(db, weights)
+        entry = CachedRanking(
+            etag=make_etag("ranking", *key),
+            body=json.dumps([r.model_dump(mode="json") for r in ranking]).encode(),
+        )
+        with self._lock:
+            # Entries of older versions age out through the LRU
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+ranking_cache = RankingCache()
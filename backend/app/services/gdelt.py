@@ -1,14 +1,222 @@
 """
 GDELT API service for fetching real-time news articles.
 """
-from datetime import datetime, timezone
-from typing import Any
+import asyncio
+import math
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
 import httpx
 
+from app.core.config import (
+    GDELT_BACKOFF_SECONDS,
+    GDELT_BASE_URL,
+    GDELT_MAX_CONCURRENCY,
+    GDELT_MAX_RETRIES,
+    GDELT_RATE_BURST,
+    GDELT_RATE_PER_SECOND,
+    GDELT_TIMEOUT_SECONDS,
+)
 from app.services.news_scoring import compute_impact_score
 
 
-GDELT_BASE_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+GDELT_MAX_RECORDS = 250  # hard cap per request
+GDELT_DATETIME_FORMAT = "%Y%m%d%H%M%S"
+MIN_WINDOW = timedelta(minutes=15)  # GDELT's time resolution
+
+TIMESPAN_UNITS = {
+    "min": timedelta(minutes=1),
+    "mins": timedelta(minutes=1),
+    "minutes": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "hours": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "days": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "weeks": timedelta(weeks=1),
+    "m": timedelta(days=30),
+    "months": timedelta(days=30),
+}
+
+# Status codes GDELT returns when throttling or temporarily unavailable
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class TokenBucket:
+    """
+    Async token bucket: refills `rate` tokens per second up to `capacity`.
+    acquire() waits until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class GdeltMetrics:
+    """Per-request timing and outcome counters for a GdeltClient."""
+
+    def __init__(self, history: int = 200):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.throttled = 0
+        self.total_seconds = 0.0
+        self.recent: deque[dict[str, Any]] = deque(maxlen=history)
+
+    def record(self, *, status: int | None, seconds: float, attempt: int) -> None:
+        self.requests += 1
+        self.total_seconds += seconds
+        if status == 429:
+            self.throttled += 1
+        self.recent.append({"status": status, "seconds": round(seconds, 4), "attempt": attempt})
+
+    def snapshot(self) -> dict[str, Any]:
+        timings = sorted(r["seconds"] for r in self.recent)
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "throttled": self.throttled,
+            "avg_seconds": round(self.total_seconds / self.requests, 4) if self.requests else None,
+            "p95_seconds": timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else None,
+            "recent": list(self.recent)[-20:],
+        }
+
+
+class GdeltClient:
+    """
+    Long-lived GDELT client sharing one pooled httpx.AsyncClient.
+
+    Requests are capped by a concurrency semaphore and a token bucket, and
+    throttling (429) / server errors (5xx) / transport errors are retried with
+    jittered exponential backoff. base_url and transport can be overridden to
+    run against a local stub server.
+    """
+
+    def __init__(
+        self,
+        base_url: str = GDELT_BASE_URL,
+        *,
+        max_concurrency: int = GDELT_MAX_CONCURRENCY,
+        rate_per_second: float = GDELT_RATE_PER_SECOND,
+        rate_burst: int = GDELT_RATE_BURST,
+        max_retries: int = GDELT_MAX_RETRIES,
+        backoff_seconds: float = GDELT_BACKOFF_SECONDS,
+        timeout: float = GDELT_TIMEOUT_SECONDS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.metrics = GdeltMetrics()
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._bucket = TokenBucket(rate_per_second, rate_burst)
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max(1, max_concurrency),
+                max_keepalive_connections=max(1, max_concurrency),
+            ),
+            transport=transport,
+        )
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        # Full jitter: uniform(0, base * 2^attempt)
+        cap = min(MAX_BACKOFF_SECONDS, self.backoff_seconds * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    async def get(self, params: dict[str, Any]) -> httpx.Response:
+        """
+        GET the GDELT endpoint with rate limiting and retries.
+        Raises httpx.HTTPStatusError / httpx.RequestError once retries are exhausted.
+        """
+        attempt = 0
+        while True:
+            response = None
+            error: httpx.RequestError | None = None
+
+            async with self._semaphore:
+                await self._bucket.acquire()
+                started = time.perf_counter()
+                try:
+                    response = await self._client.get(self.base_url, params=params)
+                except httpx.RequestError as e:
+                    error = e
+                self.metrics.record(
+                    status=response.status_code if response is not None else None,
+                    seconds=time.perf_counter() - started,
+                    attempt=attempt,
+                )
+
+            retryable = error is not None or response.status_code in RETRY_STATUS_CODES
+            if not retryable:
+                response.raise_for_status()
+                return response
+
+            if attempt >= self.max_retries:
+                self.metrics.failures += 1
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+
+            self.metrics.retries += 1
+            # Sleep outside the semaphore so other requests can proceed
+            await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_client: GdeltClient | None = None
+
+
+def get_gdelt_client() -> GdeltClient:
+    """Shared process-wide client (created lazily inside the running event loop)."""
+    global _client
+    if _client is None:
+        _client = GdeltClient()
+    return _client
+
+
+def gdelt_metrics() -> dict[str, Any] | None:
+    """Metrics of the shared client, or None if it has not been used yet."""
+    return _client.metrics.snapshot() if _client is not None else None
+
+
+async def close_gdelt_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 def infer_impact_type(title: str, summary: str) -> str:
@@ -82,16 +290,39 @@ def build_gdelt_query(
     return final_query
 
 
+def extract_gdelt_articles(data: Any) -> list[dict[str, Any]]:
+    """Pull the article list out of a GDELT JSON payload."""
+    # GDELT JSON format: can be a list directly or have "articles" field
+    articles = []
+    if isinstance(data, list):
+        articles = data
+    elif isinstance(data, dict):
+        articles = data.get("articles", [])
+        if not articles and "results" in data:
+            articles = data.get("results", [])
+        if not articles and "data" in data:
+            articles = data.get("data", [])
+    return articles
+
+
 async def fetch_gdelt_news(
     country_iso2: str | None = None,
     search_query: str | None = None,
     max_records: int = 50,
     timespan: str = "7d",  # last 7 days
+    client: GdeltClient | None = None,
+    start_datetime: datetime | None = None,
+    end_datetime: datetime | None = None,
+    raise_errors: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Fetch news articles from GDELT API.
     
-    Returns list of article dictionaries with GDELT fields.
+    Uses the shared pooled GdeltClient unless one is passed in.
+    If start_datetime/end_datetime are given they replace timespan.
+    Returns list of article dictionaries with GDELT fields; a failed request
+    returns [] unless raise_errors is set, so callers that must tell "no
+    articles" from "not fetched" can.
     """
     query = build_gdelt_query(country_iso2, search_query)
     
@@ -99,46 +330,198 @@ async def fetch_gdelt_news(
         "query": query,
         "mode": "artlist",
         "format": "json",
-        "maxrecords": min(max_records, 250),  # GDELT max is 250
+        "maxrecords": min(max_records, GDELT_MAX_RECORDS),  # GDELT max is 250
         "timespan": timespan,
         "sort": "hybridrel",  # Better source quality
         "sourcelang": "english",  # Filter to English sources
     }
+    if start_datetime or end_datetime:
+        del params["timespan"]
+        if start_datetime:
+            params["startdatetime"] = start_datetime.astimezone(timezone.utc).strftime(GDELT_DATETIME_FORMAT)
+        if end_datetime:
+            params["enddatetime"] = end_datetime.astimezone(timezone.utc).strftime(GDELT_DATETIME_FORMAT)
     
+    client = client or get_gdelt_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(GDELT_BASE_URL, params=params)
-            response.raise_for_status()
-            
-            try:
-                data = response.json()
-            except Exception:
-                return []
-            
-            # GDELT JSON format: can be a list directly or have "articles" field
-            articles = []
-            if isinstance(data, list):
-                articles = data
-            elif isinstance(data, dict):
-                articles = data.get("articles", [])
-                if not articles and "results" in data:
-                    articles = data.get("results", [])
-                if not articles and "data" in data:
-                    articles = data.get("data", [])
-            
-            return articles
+        response = await client.get(params)
+        
+        try:
+            data = response.json()
+        except Exception:
+            if raise_errors:
+                raise
+            return []
+        
+        return extract_gdelt_articles(data)
     except httpx.HTTPStatusError:
+        if raise_errors:
+            raise
         return []
     except httpx.RequestError as e:
+        if raise_errors:
+            raise
         print(f"[GDELT] Request error: {e}")
         return []
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"[GDELT] Unexpected error: {e}")
         import traceback
         traceback.print_exc()
         return []
 
 
+def parse_timespan(timespan: str) -> timedelta:
+    """
+    Parse a GDELT timespan ("90min", "24h", "7d", "2w", "3m") into a timedelta.
+    Raises ValueError for unsupported values.
+    """
+    m = re.fullmatch(r"\s*(\d+)\s*([a-z]+)\s*", (timespan or "").lower())
+    if not m or m.group(2) not in TIMESPAN_UNITS:
+        raise ValueError(f"Unsupported GDELT timespan: {timespan!r}")
+    return int(m.group(1)) * TIMESPAN_UNITS[m.group(2)]
+
+
+def split_time_windows(
+    start: datetime, end: datetime, count: int
+) -> list[tuple[datetime, datetime]]:
+    """Split [start, end) into `count` adjacent windows, newest first."""
+    count = max(1, count)
+    # Windows narrower than GDELT's resolution would return the same articles
+    max_count = max(1, int((end - start) / MIN_WINDOW))
+    count = min(count, max_count)
+    step = (end - start) / count
+    windows = []
+    for i in range(count):
+        window_end = end - step * i
+        window_start = start if i == count - 1 else window_end - step
+        windows.append((window_start, window_end))
+    return windows
+
+
+def article_url(article: dict[str, Any]) -> str | None:
+    return article.get("url") or article.get("url_mobile")
+
+
+@dataclass
+class WindowCoverage:
+    """
+    Which windows of an iter_gdelt_news_windows run were fetched completely.
+
+    A window is complete when its request succeeded, it returned fewer
+    articles than it asked for (a full response may have been capped) and
+    all of its articles were yielded.
+    """
+
+    windows: list[tuple[datetime, datetime]] = field(default_factory=list)
+    complete: set[int] = field(default_factory=set)
+    errors: int = 0
+
+    def covered_until(self) -> datetime | None:
+        """
+        End of the run of complete windows starting at the oldest one, or
+        None if the oldest window is incomplete: everything before this
+        point has been seen.
+        """
+        covered = None
+        for index in sorted(range(len(self.windows)), key=lambda i: self.windows[i][0]):
+            if index not in self.complete:
+                break
+            covered = self.windows[index][1]
+        return covered
+
+
+async def iter_gdelt_news_windows(
+    country_iso2: str | None = None,
+    search_query: str | None = None,
+    max_records: int = 50,
+    timespan: str = "7d",
+    client: GdeltClient | None = None,
+    start_datetime: datetime | None = None,
+    end_datetime: datetime | None = None,
+    coverage: WindowCoverage | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Fetch up to max_records articles, past GDELT's 250-per-request cap.
+
+    The period (timespan, or start_datetime..end_datetime) is split into
+    ceil(max_records / 250) adjacent windows which are fetched concurrently
+    (the GdeltClient still enforces the concurrency and rate limits).
+    Batches are yielded as each window completes, deduplicated by URL, and
+    iteration stops once max_records articles have been yielded.
+
+    With a coverage object, a failed window is recorded there (and skipped)
+    instead of passing as an empty one, and each fully fetched window is
+    marked complete.
+    """
+    end = end_datetime or datetime.now(timezone.utc)
+    start = start_datetime or end - parse_timespan(timespan)
+    if start >= end:
+        return
+
+    window_count = math.ceil(max_records / GDELT_MAX_RECORDS)
+    windows = split_time_windows(start, end, window_count)
+    per_window = min(GDELT_MAX_RECORDS, math.ceil(max_records / len(windows)))
+    if len(windows) < window_count:
+        # Fewer windows than needed: ask each for the full cap
+        per_window = GDELT_MAX_RECORDS
+
+    if coverage is not None:
+        coverage.windows = windows
+
+    async def fetch_window(index: int, window_start: datetime, window_end: datetime):
+        try:
+            articles = await fetch_gdelt_news(
+                country_iso2=country_iso2,
+                search_query=search_query,
+                max_records=per_window,
+                client=client,
+                start_datetime=window_start,
+                end_datetime=window_end,
+                raise_errors=coverage is not None,
+            )
+        except Exception as e:
+            print(f"[GDELT] Window {window_start:%Y-%m-%d %H:%M}..{window_end:%Y-%m-%d %H:%M} failed: {e}")
+            coverage.errors += 1
+            return index, None
+        return index, articles
+
+    tasks = [
+        asyncio.create_task(fetch_window(index, window_start, window_end))
+        for index, (window_start, window_end) in enumerate(windows)
+    ]
+
+    seen_urls: set[str] = set()
+    remaining = max_records
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, articles = await next_done
+            if articles is None:
+                continue
+            batch = []
+            truncated = False
+            for position, article in enumerate(articles):
+                url = article_url(article)
+                if not url or url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                batch.append(article)
+                if len(batch) >= remaining:
+                    truncated = position < len(articles) - 1
+                    break
+            if coverage is not None and len(articles) < per_window and not truncated:
+                coverage.complete.add(index)
+            if batch:
+                remaining -= len(batch)
+                yield batch
+            if remaining <= 0:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 def map_gdelt_to_news_item(
     gdelt_article: dict[str, Any],
     country_id: int | None = None,
@@ -0,0 +1,283 @@
+"""
+Background GDELT ingestion jobs.
+
+Jobs run as asyncio tasks in the API process and are tracked in an
+in-process registry (one registry per worker process). A periodic scheduler
+can start incremental ingests without an external cron; every worker runs
+it, but on Postgres only the one holding the scheduler's advisory lock
+starts jobs.
+"""
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import GDELT_INGEST_OVERLAP_MINUTES
+from app.db.session import SessionLocal, engine
+from app.models.country import Country
+from app.services.country_matching import CountryMatcher
+from app.services.gdelt import parse_timespan
+from app.services.news_ingest import (
+    DEFAULT_BATCH_SIZE,
+    IngestScope,
+    IngestStats,
+    load_ingest_watermarks,
+    run_gdelt_ingest,
+)
+
+
+MAX_JOB_HISTORY = 50
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+class IngestJobConflict(Exception):
+    """Raised when a job is requested while another one is still running."""
+
+    def __init__(self, running: "IngestJob"):
+        super().__init__(f"Ingest job {running.id} is already running")
+        self.running = running
+
+
+@dataclass
+class IngestParams:
+    per_country: int = 500
+    global_limit: int = 2000
+    timespan: str = "7d"
+    auto_approve: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE
+    # Only fetch articles newer than each scope's watermark (minus the overlap)
+    incremental: bool = True
+
+
+@dataclass
+class IngestJob:
+    id: str
+    params: IngestParams
+    trigger: str  # "api" | "scheduler"
+    status: str = JOB_QUEUED
+    stats: IngestStats = field(default_factory=IngestStats)
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    def as_dict(self) -> dict[str, Any]:
+        progress = self.stats.as_dict()
+        if self.finished_at and self.started_at:
+            # Freeze elapsed time/throughput once the job is over
+            elapsed = (self.finished_at - self.started_at).total_seconds()
+            progress["elapsed_seconds"] = round(elapsed, 2)
+            progress["articles_per_second"] = (
+                round(self.stats.fetched / elapsed, 1) if elapsed > 0 else 0.0
+            )
+        return {
+            "id": self.id,
+            "status": self.status,
+            "trigger": self.trigger,
+            "params": asdict(self.params),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            **progress,
+        }
+
+
+def _load_scopes(params: IngestParams) -> tuple[CountryMatcher, list[IngestScope]]:
+    db = SessionLocal()
+    try:
+        countries = db.query(Country).all()
+        matcher = CountryMatcher(countries)
+        scopes = [
+            IngestScope(country=(c.id, c.name, c.iso2), limit=params.per_country)
+            for c in countries
+        ]
+        # Also fetch global articles (no country filter)
+        scopes.append(IngestScope(country=None, limit=params.global_limit))
+
+        if params.incremental:
+            watermarks = load_ingest_watermarks(db)
+            earliest = datetime.now(timezone.utc) - parse_timespan(params.timespan)
+            overlap = timedelta(minutes=GDELT_INGEST_OVERLAP_MINUTES)
+            for scope in scopes:
+                if scope.key in watermarks:
+                    # Never reach further back than the requested timespan
+                    scope.start_datetime = max(watermarks[scope.key] - overlap, earliest)
+        return matcher, scopes
+    finally:
+        db.close()
+
+
+async def _run_job(job: IngestJob) -> None:
+    job.status = JOB_RUNNING
+    job.started_at = datetime.now(timezone.utc)
+    job.stats = IngestStats()
+    try:
+        params = job.params
+        matcher, scopes = await asyncio.to_thread(_load_scopes, params)
+        await run_gdelt_ingest(
+            scopes,
+            matcher,
+            timespan=params.timespan,
+            auto_approve=params.auto_approve,
+            batch_size=params.batch_size,
+            stats=job.stats,
+        )
+        job.status = JOB_COMPLETED
+    except asyncio.CancelledError:
+        job.status = JOB_CANCELLED
+        raise
+    except Exception as e:
+        job.status = JOB_FAILED
+        job.error = str(e)
+        print(f"[INGEST] Job {job.id} failed: {e}")
+    finally:
+        job.finished_at = datetime.now(timezone.utc)
+
+
+def _mark_cancelled_if_never_started(job: IngestJob) -> None:
+    # A task cancelled before its first step never runs _run_job's handlers
+    if job.is_active:
+        job.status = JOB_CANCELLED
+        job.finished_at = datetime.now(timezone.utc)
+
+
+class IngestJobRegistry:
+    """Tracks ingest jobs of this process; keeps the last MAX_JOB_HISTORY."""
+
+    def __init__(self):
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+
+    def running(self) -> IngestJob | None:
+        return next((job for job in self._jobs.values() if job.is_active), None)
+
+    def start(self, params: IngestParams, trigger: str = "api") -> IngestJob:
+        """Start a job; raises IngestJobConflict if one is already running."""
+        running = self.running()
+        if running:
+            raise IngestJobConflict(running)
+
+        job = IngestJob(id=uuid.uuid4().hex, params=params, trigger=trigger)
+        job.task = asyncio.create_task(_run_job(job))
+        job.task.add_done_callback(lambda _: _mark_cancelled_if_never_started(job))
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_JOB_HISTORY:
+            self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[IngestJob]:
+        return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> IngestJob | None:
+        job = self._jobs.get(job_id)
+        if job and job.is_active and job.task:
+            job.task.cancel()
+        return job
+
+    def cancel_all(self) -> None:
+        for job in self._jobs.values():
+            if job.is_active and job.task:
+                job.task.cancel()
+
+
+ingest_jobs = IngestJobRegistry()
+
+
+SCHEDULER_LOCK_KEY = 7_402_315_001  # pg advisory lock id shared by every worker
+
+
+class SchedulerLock:
+    """
+    Elects one scheduling worker across processes with a session-level
+    Postgres advisory lock, held on a dedicated connection for as long as
+    the process lives (a crashed leader's connection closes and the lock
+    passes to the next worker that asks). Other dialects have one process
+    and always hold it.
+
+    Session locks need a session: behind PgBouncer in transaction mode,
+    enable the scheduler (GDELT_INGEST_INTERVAL_MINUTES) on one instance only.
+    """
+
+    def __init__(self, bind: Engine):
+        self._engine = None
+        if bind.dialect.name == "postgresql":
+            # Outside the request pool: the connection is held indefinitely
+            self._engine = create_engine(bind.url, poolclass=NullPool)
+        self._conn: Connection | None = None
+
+    def acquire(self) -> bool:
+        """True if this process holds the lock (taking it if it is free)."""
+        if self._engine is None:
+            return True
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+                return True
+            except Exception:
+                # Connection lost, and the lock with it
+                self.release()
+        conn = self._engine.connect()
+        try:
+            held = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if held:
+            self._conn = conn
+        else:
+            conn.close()
+        return bool(held)
+
+    def release(self) -> None:
+        if self._conn is not None:
+            # Closing the session releases its advisory locks
+            self._conn.invalidate()
+            self._conn.close()
+            self._conn = None
+
+
+async def run_ingest_scheduler(interval_seconds: float, params: IngestParams) -> None:
+    """
+    Start an ingest every interval_seconds, skipping a tick while a job
+    (manual or scheduled) is still running or another worker holds the
+    scheduler lock. Runs until cancelled.
+    """
+    lock = SchedulerLock(engine)
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                if not await asyncio.to_thread(lock.acquire):
+                    continue
+            except Exception as e:
+                print(f"[INGEST] Scheduler lock check failed: {e}")
+                continue
+            try:
+                ingest_jobs.start(params, trigger="scheduler")
+            except IngestJobConflict:
+                continue
+    finally:
+        lock.release()
@@ -0,0 +1,117 @@
+"""
+In-memory investor index for project matching.
+
+Holds every investor with pre-parsed (interned) sector/stage/country sets,
+which batch_matching.BatchMatcher encodes into its hit matrices.
+
+The index is rebuilt lazily: after invalidate_investor_index() (called on
+investor create/update) or once INVESTOR_INDEX_TTL_SECONDS have passed,
+which bounds staleness across worker processes.
+"""
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import INVESTOR_INDEX_TTL_SECONDS
+from app.models.investor import Investor
+
+
+class CountryRef(NamedTuple):
+    id: int
+    name: str
+    iso2: str
+
+
+@dataclass(frozen=True, slots=True)
+class InvestorFeatures:
+    """Detached snapshot of an investor: response fields plus parsed match sets."""
+
+    id: int
+    name: str
+    investor_type: str
+    focus_sectors: str | None
+    stages: str | None
+    ticket_min: int | None
+    ticket_max: int | None
+    website: str | None
+    contact_email: str | None
+    countries: tuple[CountryRef, ...]
+
+    sector_set: frozenset[str]
+    stage_set: frozenset[str]
+    country_ids: frozenset[int]
+
+
+def parse_csv_set(value: str | None) -> frozenset[str]:
+    """Same normalisation as matching._split_csv, with interned tokens."""
+    if not value:
+        return frozenset()
+    return frozenset(sys.intern(x.strip().lower()) for x in value.split(",") if x.strip())
+
+
+class InvestorIndex:
+    def __init__(self, investors: list[Investor]):
+        self.investors: dict[int, InvestorFeatures] = {}
+
+        for inv in investors:
+            countries = tuple(CountryRef(c.id, c.name, c.iso2) for c in (inv.countries or []))
+            features = InvestorFeatures(
+                id=inv.id,
+                name=inv.name,
+                investor_type=inv.investor_type,
+                focus_sectors=inv.focus_sectors,
+                stages=inv.stages,
+                ticket_min=inv.ticket_min,
+                ticket_max=inv.ticket_max,
+                website=inv.website,
+                contact_email=inv.contact_email,
+                countries=countries,
+                sector_set=parse_csv_set(inv.focus_sectors),
+                stage_set=parse_csv_set(inv.stages),
+                country_ids=frozenset(c.id for c in countries),
+            )
+            self.investors[inv.id] = features
+
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def load(cls, db: Session) -> "InvestorIndex":
+        investors = db.query(Investor).options(selectinload(Investor.countries)).all()
+        return cls(investors)
+
+
+_index: InvestorIndex | None = None
+_generation = 0  # bumped by every invalidation
+_lock = threading.Lock()
+
+
+def _is_fresh(index: InvestorIndex | None) -> bool:
+    return index is not None and time.monotonic() - index.built_at < INVESTOR_INDEX_TTL_SECONDS
+
+
+def get_investor_index(db: Session) -> InvestorIndex:
+    """Return the current index, rebuilding it if invalidated or expired."""
+    global _index
+    index = _index
+    if _is_fresh(index):
+        return index
+    with _lock:
+        # Another request may have rebuilt it while we waited
+        if _is_fresh(_index):
+            return _index
+        generation = _generation
+        index = InvestorIndex.load(db)
+        # Don't cache a build that raced with an invalidation
+        if generation == _generation:
+            _index = index
+        return index
+
+
+def invalidate_investor_index() -> None:
+    global _index, _generation
+    _generation += 1
+    _index = None
@@ -0,0 +1,191 @@
+"""
+Persisted project <-> investor match scores (project_investor_matches).
+
+Scores only change when a project or investor changes, so they are stored
+once per pair and GET /projects/{id}/matches becomes one indexed read.
+Only pairs with a positive score are stored; investors without a stored
+row score 0 and are appended (newest first) when a read needs more
+matches than are stored.
+
+- create_project refreshes that project's row of the matrix and
+  create_investor that investor's column, in the transaction that
+  creates them
+- projects.matches_computed_at records that a project's row was computed;
+  a project without it (e.g. created before the table existed) is
+  computed and persisted on its first read
+- scripts/precompute_matches.py --write rebuilds the whole table
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.investor import Investor
+from app.models.project import Project
+from app.models.project_investor_match import ProjectInvestorMatch
+from app.services.batch_matching import BatchMatcher
+from app.services.investor_index import InvestorIndex
+from app.services.matching import _explain, _match_entry
+
+
+INSERT_CHUNK_SIZE = 1000
+
+
+def _row(project_id: int, investor_id: int, entry: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "project_id": project_id,
+        "investor_id": investor_id,
+        "score": entry["score"],
+        "score_100": entry["score_100"],
+        "country_match": entry["score_breakdown"]["country"] > 0,
+        "score_breakdown": entry["score_breakdown"],
+        "reasons": entry["reasons"],
+        "reason_points": entry["reason_points"],
+        "why": entry["why"],
+    }
+
+
+def _insert_rows(db: Session, rows: list[dict[str, Any]]) -> None:
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.execute(insert(ProjectInvestorMatch), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def _project_rows(matcher: BatchMatcher, projects: list[Project]) -> list[dict[str, Any]]:
+    per_project = matcher.top_investors(projects, limit=len(matcher.investors))
+    # Zero-score pairs are implied by a missing row
+    return [
+        _row(project_id, entry["investor"].id, entry)
+        for project_id, entries in per_project.items()
+        for entry in entries
+        if entry["score_100"] > 0
+    ]
+
+
+def _mark_computed(db: Session, *where) -> None:
+    # Core update: not a change the projects listings' table version tracks
+    db.execute(update(Project).where(*where).values(matches_computed_at=func.now()))
+
+
+def refresh_project_matches(db: Session, projects: list[Project]) -> None:
+    """
+    Recompute the stored rows of these (flushed) projects against every
+    investor, in the session's transaction; the caller commits.
+    """
+    if not projects:
+        return
+    project_ids = [p.id for p in projects]
+    # Load investors fresh: the cached index may lag behind other workers
+    matcher = BatchMatcher(InvestorIndex.load(db))
+    db.execute(delete(ProjectInvestorMatch).where(ProjectInvestorMatch.project_id.in_(project_ids)))
+    _insert_rows(db, _project_rows(matcher, projects))
+    _mark_computed(db, Project.id.in_(project_ids))
+
+
+def refresh_investor_matches(db: Session, investor: Investor) -> None:
+    """
+    Recompute the stored column of one (flushed) investor against every
+    project, in the session's transaction; the caller commits.
+    """
+    projects = db.query(Project).all()
+    matcher = BatchMatcher(InvestorIndex([investor]))
+    per_investor = matcher.top_projects(projects, limit=max(1, len(projects)))
+    db.execute(delete(ProjectInvestorMatch).where(ProjectInvestorMatch.investor_id == investor.id))
+    _insert_rows(
+        db,
+        [
+            _row(entry["project"].id, investor.id, entry)
+            for entry in per_investor[investor.id]
+            if entry["score_100"] > 0
+        ],
+    )
+
+
+def rebuild_all_matches(db: Session, matcher: BatchMatcher | None = None) -> int:
+    """Replace the whole table (every scoring project/investor pair); returns the row count."""
+    matcher = matcher or BatchMatcher(InvestorIndex.load(db))
+    rows = _project_rows(matcher, db.query(Project).all())
+    db.execute(delete(ProjectInvestorMatch))
+    _insert_rows(db, rows)
+    _mark_computed(db)
+    db.commit()
+    return len(rows)
+
+
+def _stored_matches(db: Session, project: Project, *, strict_country: bool, limit: int):
+    query = (
+        db.query(ProjectInvestorMatch, Investor)
+        .join(Investor, Investor.id == ProjectInvestorMatch.investor_id)
+        .options(selectinload(Investor.countries))
+        .filter(ProjectInvestorMatch.project_id == project.id)
+    )
+    if strict_country and project.country_id:
+        query = query.filter(ProjectInvestorMatch.country_match.is_(True))
+    return (
+        query.order_by(ProjectInvestorMatch.score_100.desc(), ProjectInvestorMatch.investor_id.desc())
+        .limit(max(1, limit))
+        .all()
+    )
+
+
+def _unmatched_entries(db: Session, project: Project, limit: int) -> list[dict[str, Any]]:
+    """Zero-score entries for the newest investors without a stored row."""
+    stored = select(ProjectInvestorMatch.investor_id).where(ProjectInvestorMatch.project_id == project.id)
+    investors = (
+        db.query(Investor)
+        .options(selectinload(Investor.countries))
+        .filter(Investor.id.not_in(stored))
+        .order_by(Investor.id.desc())
+        .limit(limit)
+        .all()
+    )
+    entries = []
+    for investor in investors:
+        entry = _match_entry(
+            investor, _explain(project, country_hit=False, sector_hit=False, stage_hit=False)
+        )
+        del entry["badges"]
+        entries.append(entry)
+    return entries
+
+
+def get_stored_matches(
+    db: Session,
+    project: Project,
+    *,
+    strict_country: bool = False,
+    limit: int = 50,
+) -> list[dict[str, Any]]:
+    """
+    Top matches for a project from project_investor_matches, in the
+    build_matches entry format (without badges). Computes and persists the
+    project's rows first if they never were; pads with zero-score
+    investors (which never match strict_country) up to limit.
+    """
+    limit = max(1, limit)
+    if project.matches_computed_at is None:
+        try:
+            refresh_project_matches(db, [project])
+            db.commit()
+        except IntegrityError:
+            # A concurrent request stored them first
+            db.rollback()
+
+    rows = _stored_matches(db, project, strict_country=strict_country, limit=limit)
+    entries = [
+        {
+            "investor": investor,
+            "score": match.score,
+            "score_100": match.score_100,
+            "reasons": match.reasons,
+            "score_breakdown": match.score_breakdown,
+            "reason_points": match.reason_points,
+            "why": match.why,
+        }
+        for match, investor in rows
+    ]
+    if len(entries) < limit and not (strict_country and project.country_id):
+        entries += _unmatched_entries(db, project, limit - len(entries))
+    return entries
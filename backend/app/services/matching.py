@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 from typing import Any
 
 from app.models.project import Project
@@ -38,18 +39,9 @@ def _build_why(*, breakdown: dict[str, int]) -> str:
     return f"Recommended due to strong {parts[0]}, {parts[1]}, and {parts[2]}."
 
 
-def score_investor_for_project(
-    project: Project, investor: Investor
+def _explain(
+    project: Project, *, country_hit: bool, sector_hit: bool, stage_hit: bool
 ) -> tuple[int, list[str], dict[str, int], list[str], list[dict[str, Any]], str]:
-    """
-    Returns:
-      - raw_score: int (legacy, 0..5)
-      - reasons: list[str] (legacy strings)
-      - breakdown: dict[str, int] (0..100 contribution buckets)
-      - badges: list[str] (short labels for UI)
-      - reason_points: list[{"label": str, "points": int}] (new, UI-friendly)
-      - why: str (new, single sentence)
-    """
     reasons: list[str] = []
     badges: list[str] = []
     reason_points: list[dict[str, Any]] = []
@@ -63,7 +55,7 @@ def score_investor_for_project(
     }
 
     # Country match (+2) -> 40
-    if _country_match(project, investor):
+    if country_hit:
         raw_score += 2
         reasons.append("Country match")
         badges.append("Strong geo fit")
@@ -71,9 +63,7 @@ def score_investor_for_project(
         reason_points.append({"label": "Country match", "points": 40})
 
     # Sector match (+2) -> 40
-    proj_sector = (project.sector or "").strip().lower()
-    inv_sectors = _split_csv(investor.focus_sectors)
-    if proj_sector and proj_sector in inv_sectors:
+    if sector_hit:
         raw_score += 2
         reasons.append(f"Sector match: {project.sector}")
         badges.append("Sector match")
@@ -81,9 +71,7 @@ def score_investor_for_project(
         reason_points.append({"label": f"Sector match: {project.sector}", "points": 40})
 
     # Stage match (+1) -> 20
-    proj_stage = (project.stage or "").strip().lower()
-    inv_stages = _split_csv(investor.stages)
-    if proj_stage and proj_stage in inv_stages:
+    if stage_hit:
         raw_score += 1
         reasons.append(f"Stage match: {project.stage}")
         badges.append("Stage aligned")
@@ -99,6 +87,63 @@ def score_investor_for_project(
     return raw_score, reasons, breakdown, badges, reason_points, why
 
 
+def score_investor_for_project(
+    project: Project, investor: Investor
+) -> tuple[int, list[str], dict[str, int], list[str], list[dict[str, Any]], str]:
+    """
+    Returns:
+      - raw_score: int (legacy, 0..5)
+      - reasons: list[str] (legacy strings)
+      - breakdown: dict[str, int] (0..100 contribution buckets)
+      - badges: list[str] (short labels for UI)
+      - reason_points: list[{"label": str, "points": int}] (new, UI-friendly)
+      - why: str (new, single sentence)
+    """
+    proj_sector = (project.sector or "").strip().lower()
+    proj_stage = (project.stage or "").strip().lower()
+
+    return _explain(
+        project,
+        country_hit=_country_match(project, investor),
+        sector_hit=bool(proj_sector) and proj_sector in _split_csv(investor.focus_sectors),
+        stage_hit=bool(proj_stage) and proj_stage in _split_csv(investor.stages),
+    )
+
+
+def _match_entry(
+    investor: Any,
+    scored: tuple[int, list[str], dict[str, int], list[str], list[dict[str, Any]], str],
+) -> dict[str, Any]:
+    raw_score, reasons, breakdown, badges, reason_points, why = scored
+    score_100 = breakdown["country"] + breakdown["sector"] + breakdown["stage"]
+    return {
+        "investor": investor,
+        "score": raw_score,          # legacy (0..5)
+        "score_100": score_100,      # new (0..100)
+        "reasons": reasons,          # legacy strings (still useful)
+        "score_breakdown": breakdown,
+        "badges": badges,
+        "reason_points": reason_points,
+        "why": why,
+    }
+
+
+def _score_100(country_hit: bool, sector_hit: bool, stage_hit: bool) -> int:
+    # Must agree with the breakdown buckets in _explain
+    return 40 * country_hit + 40 * sector_hit + 20 * stage_hit
+
+
+def _top_k(scored: list[tuple[int, int, Any, tuple[bool, bool, bool]]], limit: int | None):
+    """
+    Order (score_100, investor_id, investor, hits) tuples by score then id,
+    both descending. With a limit only the best `limit` are kept, using a
+    bounded heap instead of sorting everything.
+    """
+    if limit is None:
+        return sorted(scored, key=lambda x: (x[0], x[1]), reverse=True)
+    return heapq.nlargest(max(1, limit), scored, key=lambda x: (x[0], x[1]))
+
+
 def build_matches(
     project: Project,
     investors: list[Investor],
@@ -106,32 +151,28 @@ def build_matches(
     strict_country: bool = False,
     limit: int | None = None,
 ) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
+    proj_sector = (project.sector or "").strip().lower()
+    proj_stage = (project.stage or "").strip().lower()
 
+    # Cheap numeric pass; reasons/badges/why are only built for the top `limit`
+    scored = []
     for inv in investors:
-        if strict_country and project.country_id and not _country_match(project, inv):
+        country_hit = _country_match(project, inv)
+        if strict_country and project.country_id and not country_hit:
             continue
 
-        raw_score, reasons, breakdown, badges, reason_points, why = score_investor_for_project(project, inv)
-
-        score_100 = breakdown["country"] + breakdown["sector"] + breakdown["stage"]
-
-        out.append(
-            {
-                "investor": inv,
-                "score": raw_score,          # legacy (0..5)
-                "score_100": score_100,      # new (0..100)
-                "reasons": reasons,          # legacy strings (still useful)
-                "score_breakdown": breakdown,
-                "badges": badges,
-                "reason_points": reason_points,
-                "why": why,
-            }
+        hits = (
+            country_hit,
+            bool(proj_sector) and proj_sector in _split_csv(inv.focus_sectors),
+            bool(proj_stage) and proj_stage in _split_csv(inv.stages),
         )
+        scored.append((_score_100(*hits), inv.id, inv, hits))
 
-    out.sort(key=lambda x: (x["score_100"], x["investor"].id), reverse=True)
-
-    if limit is not None:
-        return out[: max(1, limit)]
+    return [
+        _match_entry(
+            inv,
+            _explain(project, country_hit=hits[0], sector_hit=hits[1], stage_hit=hits[2]),
+        )
+        for _, _, inv, hits in _top_k(scored, limit)
+    ]
 
-    return out
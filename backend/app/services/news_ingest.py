@@ -0,0 +1,451 @@
+"""
+GDELT ingestion pipeline: fetch -> match/map -> batched write.
+
+Stages are connected by bounded asyncio queues so memory stays flat and slow
+stages apply backpressure to faster ones. Matching/mapping and DB writes run
+in the thread pool, keeping the event loop free for API requests.
+
+Articles are written in chunks, each one transaction of
+INSERT ... ON CONFLICT (source_url) DO NOTHING RETURNING id
+statements sized to the dialect's bound-parameter limit, instead of one
+SELECT + COMMIT per article. A chunk that fails is retried in halves, so
+one bad row only loses itself.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy import func
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.response_cache import response_cache
+from app.db.session import SessionLocal
+from app.db.table_versions import bump_table_versions
+from app.models.news_ingest_watermark import NewsIngestWatermark
+from app.models.news_item import NewsItem
+from app.services.country_matching import CountryMatcher, MatchResult
+from app.services.gdelt import (
+    GdeltClient,
+    WindowCoverage,
+    article_url,
+    iter_gdelt_news_windows,
+    map_gdelt_to_news_item,
+)
+
+
+DEFAULT_BATCH_SIZE = 500
+ARTICLE_QUEUE_SIZE = 1000  # fetched articles waiting to be matched/mapped
+ROW_QUEUE_BATCHES = 4  # mapped batches waiting for the writer
+MAP_CHUNK_SIZE = 100  # articles matched/mapped per thread pool call
+
+_DONE = object()  # end-of-stream marker passed between stages
+
+# Bound parameters allowed in one statement (SQLite's default compile-time
+# limit before 3.32 is 999; Postgres' wire protocol allows 65535)
+MAX_BIND_PARAMS = {"postgresql": 65535, "sqlite": 999}
+
+# Columns written for every ingested row (created_at comes from the DB default)
+NEWS_ROW_FIELDS = (
+    "country_id",
+    "status",
+    "impact_type",
+    "impact_score",
+    "title",
+    "summary",
+    "tags",
+    "source_name",
+    "source_url",
+    "image_url",
+    "published_at",
+)
+
+
+def build_news_row(mapped: dict[str, Any], status: str) -> dict[str, Any]:
+    """Turn the output of map_gdelt_to_news_item into an insertable row."""
+    row = {field: mapped.get(field) for field in NEWS_ROW_FIELDS}
+    row["status"] = status
+    return row
+
+
+def map_article_row(
+    article: dict[str, Any],
+    fetch_country: MatchResult | None,
+    matcher: CountryMatcher,
+    status: str,
+) -> dict[str, Any]:
+    """
+    Match an article to a country and map it to an insertable row.
+
+    fetch_country is the (id, name, iso2) the article was fetched for with a
+    sourcecountry filter, or None for the global fetch.
+    """
+    # Match country - if we fetched with a country filter, prioritize that country
+    if fetch_country:
+        # When we fetch with sourcecountry filter, articles should be from that country
+        # Try matching first to see if GDELT confirms it; otherwise use the
+        # country we filtered for (most reliable)
+        matched = matcher.match(article)
+        country_id, country_name, country_iso2 = (
+            matched if matched[0] == fetch_country[0] else fetch_country
+        )
+    else:
+        # For global articles, try to match from content
+        country_id, country_name, country_iso2 = matcher.match(article)
+
+    mapped = map_gdelt_to_news_item(
+        article,
+        country_id=country_id,
+        country_name=country_name,
+        country_iso2=country_iso2,
+    )
+    return build_news_row(mapped, status)
+
+
+def _insert_ignoring_duplicates(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(NewsItem)
+    if dialect == "sqlite":
+        return sqlite.insert(NewsItem)
+    raise RuntimeError(f"Batched news insert is not supported on dialect '{dialect}'")
+
+
+def insert_news_batch(db: Session, rows: list[dict[str, Any]]) -> tuple[int, int]:
+    """
+    Insert one chunk of rows in one transaction and commit, with as few
+    statements as the dialect's bound-parameter limit allows.
+
+    Rows whose source_url already exists (in the DB or earlier in the same
+    chunk) are skipped by the unique constraint.
+
+    Returns: (inserted, skipped)
+    """
+    if not rows:
+        return 0, 0
+
+    # ON CONFLICT cannot touch the same row twice in one statement
+    unique_rows = []
+    seen_urls = set()
+    for row in rows:
+        url = row.get("source_url")
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        unique_rows.append(row)
+
+    insert = _insert_ignoring_duplicates(db)
+    params_limit = MAX_BIND_PARAMS.get(db.get_bind().dialect.name, 999)
+    per_statement = max(1, params_limit // len(NEWS_ROW_FIELDS))
+    inserted_ids = []
+    for start in range(0, len(unique_rows), per_statement):
+        stmt = (
+            insert.values(unique_rows[start:start + per_statement])
+            .on_conflict_do_nothing(index_elements=["source_url"])
+            .returning(NewsItem.id)
+        )
+        inserted_ids += db.execute(stmt).scalars().all()
+    if inserted_ids:
+        # Core insert: not seen by the flush hook
+        bump_table_versions(db, [NewsItem.__tablename__])
+    db.commit()
+
+    inserted = len(inserted_ids)
+    return inserted, len(rows) - inserted
+
+
+GLOBAL_SCOPE = "GLOBAL"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything here is UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def load_ingest_watermarks(db: Session) -> dict[str, datetime]:
+    """Last stored seendate per scope key (country ISO2 or GLOBAL)."""
+    return {
+        w.scope: _as_utc(w.last_seen_at)
+        for w in db.query(NewsIngestWatermark).all()
+    }
+
+
+def save_ingest_watermarks(db: Session, watermarks: dict[str, datetime]) -> None:
+    """Upsert watermarks and commit; a watermark never moves backwards."""
+    if not watermarks:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(NewsIngestWatermark)
+        newest = func.greatest(NewsIngestWatermark.last_seen_at, stmt.excluded.last_seen_at)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(NewsIngestWatermark)
+        newest = func.max(NewsIngestWatermark.last_seen_at, stmt.excluded.last_seen_at)
+    else:
+        raise RuntimeError(f"Ingest watermarks are not supported on dialect '{dialect}'")
+
+    stmt = stmt.values(
+        [{"scope": scope, "last_seen_at": seen} for scope, seen in watermarks.items()]
+    ).on_conflict_do_update(
+        index_elements=["scope"],
+        set_={"last_seen_at": newest, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+@dataclass
+class IngestScope:
+    """
+    One GDELT fetch: a country (sourcecountry filter) or global when None.
+    start_datetime narrows the fetch to articles newer than a watermark.
+    """
+
+    country: MatchResult | None
+    limit: int
+    start_datetime: datetime | None = None
+
+    @property
+    def key(self) -> str:
+        return self.country[2].upper() if self.country else GLOBAL_SCOPE
+
+
+@dataclass
+class IngestStats:
+    """Live counters for a pipeline run (read by progress reporting)."""
+
+    fetched: int = 0
+    matched: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    failed: int = 0  # rows the database rejected or could not take
+    fetch_errors: int = 0  # failed scopes and windows
+    started_at: float = field(default_factory=time.monotonic)
+    # Newest published_at successfully stored per scope key
+    watermarks: dict[str, datetime] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "total_fetched": self.fetched,
+            "matched": self.matched,
+            "fetch_errors": self.fetch_errors,
+            "elapsed_seconds": round(elapsed, 2),
+            "articles_per_second": round(self.fetched / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+def _map_chunk(
+    chunk: list[tuple[dict[str, Any], IngestScope]],
+    matcher: CountryMatcher,
+    status: str,
+) -> tuple[list[tuple[dict[str, Any], str]], int]:
+    rows = []
+    failed = 0
+    for article, scope in chunk:
+        try:
+            rows.append((map_article_row(article, scope.country, matcher, status), scope.key))
+        except Exception:
+            failed += 1
+    return rows, failed
+
+
+def _write_in_session(
+    session_factory: Callable[[], Session],
+    rows: list[dict[str, Any]],
+) -> tuple[int, int]:
+    # Runs in a worker thread, so it gets its own session
+    db = session_factory()
+    try:
+        return insert_news_batch(db, rows)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _write_with_retry(
+    session_factory: Callable[[], Session],
+    batch: list[tuple[dict[str, Any], str]],
+) -> tuple[int, int, list[tuple[dict[str, Any], str]]]:
+    """
+    Write (row, scope key) pairs; an insert rejected for its data is
+    retried in halves down to single rows. Any other error (connection,
+    pool timeout) fails the whole batch, since splitting it would only
+    repeat the failure. Returns (inserted, skipped, failed pairs).
+    """
+    try:
+        inserted, skipped = _write_in_session(session_factory, [row for row, _ in batch])
+        return inserted, skipped, []
+    except (IntegrityError, DataError) as e:
+        if len(batch) == 1:
+            print(f"[INGEST] Insert failed for {batch[0][0].get('source_url')}: {e}")
+            return 0, 0, batch
+    except Exception as e:
+        print(f"[INGEST] Insert of {len(batch)} rows failed: {e}")
+        return 0, 0, batch
+    mid = len(batch) // 2
+    first = _write_with_retry(session_factory, batch[:mid])
+    second = _write_with_retry(session_factory, batch[mid:])
+    return first[0] + second[0], first[1] + second[1], first[2] + second[2]
+
+
+def _save_in_session(
+    session_factory: Callable[[], Session],
+    watermarks: dict[str, datetime],
+) -> None:
+    db = session_factory()
+    try:
+        save_ingest_watermarks(db, watermarks)
+    finally:
+        db.close()
+
+
+async def run_gdelt_ingest(
+    scopes: list[IngestScope],
+    matcher: CountryMatcher,
+    *,
+    timespan: str = "7d",
+    auto_approve: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    client: GdeltClient | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    stats: IngestStats | None = None,
+    update_watermarks: bool = True,
+) -> IngestStats:
+    """
+    Run the staged ingest pipeline and return its counters.
+
+    fetch producers (one per scope, windows fetched concurrently)
+      -> article queue -> match/map stage (thread pool, MAP_CHUNK_SIZE chunks)
+      -> row queue -> batched writer (thread pool, own session)
+
+    Once every stage has finished, the newest stored seendate of each scope
+    whose fetch did not fail is saved as its watermark, but never past the
+    end of the scope's oldest run of complete windows: a window that failed
+    or came back capped at its record limit (or the oldest window itself)
+    is fetched again next time. Windows complete out of order, so a
+    cancelled or failed run does not advance any watermark.
+
+    Pass a stats object to observe progress while the pipeline runs.
+    """
+    stats = stats or IngestStats()
+    status = "approved" if auto_approve else "pending"
+    batch_size = max(1, batch_size)
+    run_started = datetime.now(timezone.utc)
+    failed_scopes: set[str] = set()
+    coverage: dict[str, WindowCoverage] = {}
+
+    article_queue: asyncio.Queue = asyncio.Queue(maxsize=ARTICLE_QUEUE_SIZE)
+    row_queue: asyncio.Queue = asyncio.Queue(maxsize=ROW_QUEUE_BATCHES)
+    seen_urls: set[str] = set()
+
+    async def produce(scope: IngestScope) -> None:
+        scope_coverage = coverage[scope.key] = WindowCoverage()
+        try:
+            async for articles in iter_gdelt_news_windows(
+                country_iso2=scope.country[2] if scope.country else None,
+                search_query=None,
+                max_records=scope.limit,
+                timespan=timespan,
+                client=client,
+                start_datetime=scope.start_datetime,
+                end_datetime=run_started,
+                coverage=scope_coverage,
+            ):
+                for article in articles:
+                    url = article_url(article)
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                    stats.fetched += 1
+                    await article_queue.put((article, scope))
+        except Exception as e:
+            stats.fetch_errors += 1
+            failed_scopes.add(scope.key)
+            print(f"[INGEST] Fetch failed for {scope.key}: {e}")
+        stats.fetch_errors += scope_coverage.errors
+
+    async def produce_all() -> None:
+        await asyncio.gather(*(produce(scope) for scope in scopes))
+        await article_queue.put(_DONE)
+
+    async def map_stage() -> None:
+        pending_rows: list[tuple[dict[str, Any], str]] = []
+        done = False
+        while not done:
+            chunk = []
+            item = await article_queue.get()
+            while item is not _DONE:
+                chunk.append(item)
+                if len(chunk) >= MAP_CHUNK_SIZE or article_queue.empty():
+                    break
+                item = article_queue.get_nowait()
+            done = item is _DONE
+
+            if chunk:
+                rows, failed = await asyncio.to_thread(_map_chunk, chunk, matcher, status)
+                stats.skipped += failed
+                stats.matched += sum(1 for row, _ in rows if row["country_id"] is not None)
+                pending_rows.extend(rows)
+
+            while len(pending_rows) >= batch_size or (done and pending_rows):
+                await row_queue.put(pending_rows[:batch_size])
+                pending_rows = pending_rows[batch_size:]
+        await row_queue.put(_DONE)
+
+    async def write_stage() -> None:
+        while (batch := await row_queue.get()) is not _DONE:
+            inserted, skipped, failed = await asyncio.to_thread(
+                _write_with_retry, session_factory, batch
+            )
+            stats.inserted += inserted
+            stats.skipped += skipped
+            stats.failed += len(failed)
+            # A lost row must be fetched again: keep its scope's watermark
+            failed_scopes.update(key for _, key in failed)
+            if inserted and status == "approved":
+                # A network round-trip with the Redis backend
+                await asyncio.to_thread(
+                    response_cache.invalidate_entity,
+                    "news",
+                    *{row["country_id"] for row, _ in batch},
+                )
+            # Inserted or already present: either way the article is stored
+            failed_rows = {id(row) for row, _ in failed}
+            for row, key in batch:
+                if id(row) in failed_rows:
+                    continue
+                seen = row["published_at"]
+                if key not in stats.watermarks or seen > stats.watermarks[key]:
+                    stats.watermarks[key] = seen
+
+    stages = [asyncio.create_task(stage()) for stage in (produce_all, map_stage, write_stage)]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        # The other stages would wait forever on their queues
+        for task in stages:
+            task.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        raise
+
+    if update_watermarks:
+        # Unparseable seendates are mapped to "now"; never go past the run
+        # start or past the first window that was not fully fetched
+        watermarks = {}
+        for key, seen in stats.watermarks.items():
+            covered = coverage[key].covered_until() if key in coverage else None
+            if key in failed_scopes or covered is None:
+                continue
+            watermarks[key] = min(seen, covered, run_started)
+        await asyncio.to_thread(_save_in_session, session_factory, watermarks)
+    return stats
@@ -0,0 +1,261 @@
+"""
+Ranked full-text search over news, resources, policies and frameworks, and
+trigram substring search for the directory listings.
+
+On Postgres each searchable table has a generated, GIN-indexed
+`search_vector` column (title weighted A, body weighted B; see alembic
+revision e5f6a7b8c9d0). Queries use websearch_to_tsquery, are ordered by
+ts_rank and return ts_headline snippets.
+
+Elsewhere (SQLite in tests/dev, or before the migration has run) an
+in-process fallback keeps the rows matching every query term with ILIKE,
+like websearch_to_tsquery ANDs them, and ranks and highlights the
+candidates in Python. Whether full-text search and pg_trgm are available
+is re-checked every SEARCH_FEATURE_CHECK_TTL_SECONDS.
+
+Directory listings (projects, investors, library) use apply_text_search:
+with pg_trgm installed it adds typo-tolerant word_similarity matches and
+orders by similarity, backed by GIN trigram indexes (alembic revision
+f6a7b8c9d0e1); without it the filter is the plain ILIKE it always was.
+"""
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy import and_, func, inspect, literal, literal_column, or_, text
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import SEARCH_FEATURE_CHECK_TTL_SECONDS
+
+from app.models.country_framework import CountryFramework
+from app.models.country_policy import CountryPolicy
+from app.models.news_item import NewsItem
+from app.models.resource import Resource
+
+
+SEARCH_LIMIT = 20
+FALLBACK_CANDIDATES = 200  # rows ranked in Python per section by the fallback
+TS_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=35, MinWords=15"
+)
+SNIPPET_CHARS = 200
+
+
+@dataclass(frozen=True)
+class SearchSection:
+    """One searchable table and how its hits are filtered, ordered and serialized."""
+
+    key: str
+    model: Any
+    title: Any
+    body: Any
+    tiebreak: Any
+    serialize: Callable[[Any], dict[str, Any]]
+    approved_only: bool = False
+
+    @property
+    def vector(self):
+        return literal_column(f"{self.model.__tablename__}.search_vector")
+
+    def base_query(self, db: Session, country_id: int | None, *columns):
+        query = db.query(self.model, *columns)
+        if self.approved_only:
+            query = query.filter(self.model.status == "approved")
+        if country_id is not None:
+            query = query.filter(self.model.country_id == country_id)
+        return query
+
+
+SECTIONS = [
+    SearchSection(
+        key="news",
+        model=NewsItem,
+        title=NewsItem.title,
+        body=NewsItem.summary,
+        tiebreak=NewsItem.published_at.desc(),
+        approved_only=True,
+        serialize=lambda n: {
+            "id": n.id,
+            "country_id": n.country_id,
+            "title": n.title,
+            "summary": n.summary,
+            "impact_type": n.impact_type,
+            "impact_score": n.impact_score,
+            "published_at": n.published_at,
+            "source_url": n.source_url,
+        },
+    ),
+    SearchSection(
+        key="resources",
+        model=Resource,
+        title=Resource.title,
+        body=Resource.abstract,
+        tiebreak=Resource.submitted_at.desc(),
+        approved_only=True,
+        serialize=lambda r: {
+            "id": r.id,
+            "country_id": r.country_id,
+            "title": r.title,
+            "abstract": r.abstract,
+            "url": r.url,
+            "resource_type": r.resource_type,
+            "published_at": r.published_at,
+        },
+    ),
+    SearchSection(
+        key="policies",
+        model=CountryPolicy,
+        title=CountryPolicy.title,
+        body=CountryPolicy.summary,
+        tiebreak=CountryPolicy.id.asc(),
+        serialize=lambda p: {"id": p.id, "country_id": p.country_id, "title": p.title},
+    ),
+    SearchSection(
+        key="frameworks",
+        model=CountryFramework,
+        title=CountryFramework.name,
+        body=CountryFramework.description,
+        tiebreak=CountryFramework.id.asc(),
+        serialize=lambda f: {"id": f.id, "country_id": f.country_id, "name": f.name},
+    ),
+]
+
+
+# engine URL -> (checked at, available)
+_fulltext_by_engine: dict[str, tuple[float, bool]] = {}
+
+
+def _cached_check(cache: dict[str, tuple[float, bool]], db: Session, check: Callable[[Session], bool]) -> bool:
+    key = str(db.get_bind().url)
+    entry = cache.get(key)
+    now = time.monotonic()
+    if entry is None or now - entry[0] >= SEARCH_FEATURE_CHECK_TTL_SECONDS:
+        entry = cache[key] = (now, check(db))
+    return entry[1]
+
+
+def _has_search_vectors(db: Session) -> bool:
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    columns = inspect(bind).get_columns(NewsItem.__tablename__)
+    return any(c["name"] == "search_vector" for c in columns)
+
+
+def fulltext_available(db: Session) -> bool:
+    """Postgres with the search_vector columns migrated (cached per engine for a while)."""
+    return _cached_check(_fulltext_by_engine, db, _has_search_vectors)
+
+
+def _search_postgres(db: Session, section: SearchSection, q: str, country_id: int | None):
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, q)
+    rank = func.ts_rank(section.vector, tsquery)
+    # Postgres evaluates the headline only for the rows that survive the LIMIT
+    snippet = func.ts_headline(TS_CONFIG, section.body, tsquery, HEADLINE_OPTIONS)
+    rows = (
+        section.base_query(db, country_id, rank.label("rank"), snippet.label("snippet"))
+        .filter(section.vector.op("@@")(tsquery))
+        .order_by(rank.desc(), section.tiebreak)
+        .limit(SEARCH_LIMIT)
+        .all()
+    )
+    return [(obj, float(r), s) for obj, r, s in rows]
+
+
+def _terms(q: str) -> list[str]:
+    return [t for t in re.findall(r"\w+", q.lower()) if len(t) > 1] or [q.strip().lower()]
+
+
+def _highlight(text: str, terms: list[str]) -> str:
+    """Cut a snippet around the first hit and wrap every hit in <mark>."""
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - SNIPPET_CHARS // 3) if first else 0
+    snippet = text[start:start + SNIPPET_CHARS]
+    snippet = pattern.sub(lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_STOP}", snippet)
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if start + SNIPPET_CHARS < len(text) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+def _search_fallback(db: Session, section: SearchSection, q: str, country_id: int | None):
+    terms = _terms(q)
+    # Every term, in the title or the body (websearch_to_tsquery ANDs terms too)
+    matches_all = and_(
+        *(or_(section.title.ilike(f"%{t}%"), section.body.ilike(f"%{t}%")) for t in terms)
+    )
+    candidates = (
+        section.base_query(db, country_id)
+        .filter(matches_all)
+        .order_by(section.tiebreak)
+        .limit(FALLBACK_CANDIDATES)
+        .all()
+    )
+
+    title_key = section.title.key
+    body_key = section.body.key
+    scored = []
+    for position, obj in enumerate(candidates):
+        title = (getattr(obj, title_key) or "").lower()
+        body = (getattr(obj, body_key) or "").lower()
+        # Title hits weigh more, like the A/B weights of the tsvector
+        rank = sum(3 * title.count(t) + body.count(t) for t in terms)
+        scored.append((rank, position, obj))
+
+    # Stable on the tiebreak order the candidates were loaded in
+    scored.sort(key=lambda x: (-x[0], x[1]))
+    return [
+        (obj, float(rank), _highlight(getattr(obj, body_key) or "", terms))
+        for rank, _, obj in scored[:SEARCH_LIMIT]
+    ]
+
+
+def search_all(db: Session, q: str, country_id: int | None = None) -> dict[str, list[dict[str, Any]]]:
+    """Run the search over every section; hits are ordered by relevance."""
+    run = _search_postgres if fulltext_available(db) else _search_fallback
+    return {
+        section.key: [
+            {**section.serialize(obj), "rank": rank, "snippet": snippet}
+            for obj, rank, snippet in run(db, section, q, country_id)
+        ]
+        for section in SECTIONS
+    }
+
+
+_trigram_by_engine: dict[str, tuple[float, bool]] = {}
+
+
+def _has_trigram(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first())
+
+
+def trigram_available(db: Session) -> bool:
+    """Postgres with the pg_trgm extension installed (cached per engine for a while)."""
+    return _cached_check(_trigram_by_engine, db, _has_trigram)
+
+
+def apply_text_search(db: Session, query: Query, q: str, columns: list, *order_by) -> Query:
+    """
+    Filter a listing query by `q` over `columns` and apply its ordering.
+
+    Always keeps the ILIKE '%q%' substring match. With pg_trgm it also
+    accepts rows where q is word-similar to a column (typos, partial words)
+    and orders by the best similarity before the listing's own order_by.
+    """
+    like = f"%{q}%"
+    matches = [col.ilike(like) for col in columns]
+
+    if not trigram_available(db):
+        return query.filter(or_(*matches)).order_by(*order_by)
+
+    term = literal(q)
+    # `q <% col` is word_similarity(q, col) >= pg_trgm.word_similarity_threshold
+    matches += [term.op("<%")(col) for col in columns]
+    similarity = func.greatest(*(func.word_similarity(term, func.coalesce(col, "")) for col in columns))
+    return query.filter(or_(*matches)).order_by(similarity.desc(), *order_by)
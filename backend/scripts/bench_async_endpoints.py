@@ -0,0 +1,102 @@
+"""
+Load-test the read endpoints served from the async session.
+
+Fires concurrent GETs at a running API with httpx.AsyncClient and prints
+throughput and p50/p99 latency per endpoint. To compare with the
+threadpool build, run the previous revision on another port and pass both
+base URLs; each is measured in turn with the same load.
+
+Response caches would hide the database path, so requests carry a
+throwaway query parameter that makes every URL unique (pass --cached to
+measure cache hits instead).
+
+Usage (from backend/, with the API running):
+    python -m scripts.bench_async_endpoints \
+        --base-url async=http://localhost:8000 --base-url threads=http://localhost:8001 \
+        --concurrency 64 --requests 2000
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+
+import httpx
+
+
+ENDPOINTS = {
+    "news feed": "/api/v1/news?limit=20",
+    "news country": "/api/v1/news?country_id=cececo&limit=20",
+    "country detail": "/api/v1/countries/1",
+    "search": "/api/v1/search?q=solar",
+}
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient, path: str, *, concurrency: int, requests: int, cached: bool
+) -> tuple[float, float, float, int]:
+    """(requests/s, p50 ms, p99 ms, errors) for `requests` GETs at `concurrency`."""
+    counter = itertools.count()
+    samples: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while (n := next(counter)) < requests:
+            url = path if cached else f"{path}{'&' if '?' in path else '?'}_bench={n}"
+            t0 = time.perf_counter()
+            try:
+                response = await client.get(url)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            samples.append((time.perf_counter() - t0) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return requests / elapsed, statistics.median(samples), p99, errors
+
+
+async def bench(label: str, base_url: str, args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        for path in ENDPOINTS.values():
+            await client.get(path)  # warm up
+        for name, path in ENDPOINTS.items():
+            rps, p50, p99, errors = await run_endpoint(
+                client, path, concurrency=args.concurrency, requests=args.requests, cached=args.cached
+            )
+            print(f"{label:<10} {name:<16} {rps:>9.1f} {p50:>9.2f} {p99:>9.2f} {errors:>7}")
+
+
+def parse_base_url(value: str) -> tuple[str, str]:
+    label, sep, url = value.partition("=")
+    return (label, url) if sep else (value, value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--base-url",
+        action="append",
+        type=parse_base_url,
+        help="[label=]URL of a running API; repeat to compare builds (default http://localhost:8000)",
+    )
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per endpoint")
+    parser.add_argument("--cached", action="store_true", help="reuse URLs so response caches can hit")
+    args = parser.parse_args()
+
+    targets = args.base_url or [("api", "http://localhost:8000")]
+    print(f"{'build':<10} {'endpoint':<16} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for label, url in targets:
+        asyncio.run(bench(label, url, args))
+
+
+if __name__ == "__main__":
+    main()
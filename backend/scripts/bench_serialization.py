@@ -0,0 +1,149 @@
+"""
+Benchmark JSON serialization of the hot list payloads, before and after
+the orjson / direct serialization path.
+
+Builds synthetic payloads shaped like the real responses (news feed items,
+project listings, project -> investor matches) at each --sizes and times:
+
+    before   what the routes used to hand FastAPI: schema instances and
+             dicts, run through jsonable_encoder + json.dumps
+    after    what they return now: dicts rendered by orjson, schema
+             instances by pydantic's dump_json (app.core.responses)
+
+and prints the best-of --runs time in milliseconds for each.
+
+Usage (from backend/):
+    python -m scripts.bench_serialization --sizes 1000 10000 --runs 5
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import ORJSON_OPTIONS, type_adapter
+from app.schemas.country import CountryOut
+from app.schemas.news_item import NewsItemOut
+from app.schemas.project import ProjectOut
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def news_items(n: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "country_id": i % 7 or None,
+            "country_name": f"Country {i % 7}" if i % 7 else "Global",
+            "country_iso2": "AZ" if i % 7 else None,
+            "status": "approved",
+            "impact_type": "policy",
+            "impact_score": i % 100,
+            "title": f"Renewable energy headline number {i}",
+            "summary": "Synthetic summary about solar, wind and grid investment. " * 3,
+            "tags": "solar,wind",
+            "source_name": "Bench",
+            "source_url": f"https://bench.invalid/news/{i}",
+            "image_url": None,
+            "published_at": NOW - timedelta(minutes=i),
+            "created_at": NOW,
+        }
+        for i in range(n)
+    ]
+
+
+def projects(n: int) -> list[ProjectOut]:
+    country = CountryOut.model_construct(id=1, name="Azerbaijan", iso2="AZ", region="Caucasus")
+    return [
+        ProjectOut.model_construct(
+            id=i,
+            kind="project",
+            country_id=1,
+            country=country,
+            title=f"Solar plant {i}",
+            summary="Synthetic project summary for the serialization benchmark.",
+            sector="Solar",
+            stage="seed",
+            website=None,
+            created_at=NOW - timedelta(hours=i),
+        )
+        for i in range(n)
+    ]
+
+
+def matches(n: int) -> list[dict]:
+    investor = {
+        "id": 1,
+        "name": "Bench Capital",
+        "investor_type": "fund",
+        "focus_sectors": "Solar,Wind",
+        "stages": "seed,seriesA",
+        "ticket_min": 100000,
+        "ticket_max": 5000000,
+        "website": "https://bench.invalid",
+        "contact_email": None,
+        "countries": [{"id": 1, "name": "Azerbaijan", "iso2": "AZ"}],
+    }
+    return [
+        {
+            "score": 5,
+            "score_100": 80,
+            "why": "Country match + sector match",
+            "score_breakdown": {"country": 40, "sector": 40, "stage": 0},
+            "reason_points": ["Country match", "Sector match"],
+            "reasons": ["country", "sector"],
+            "investor": {**investor, "id": i},
+        }
+        for i in range(n)
+    ]
+
+
+def before(content) -> bytes:
+    # fastapi.responses.JSONResponse.render after jsonable_encoder
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def best_ms(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    projects_adapter = type_adapter(list[ProjectOut])
+    print(f"{'payload':<10} {'items':>7} {'before ms':>10} {'after ms':>9} {'speedup':>8}")
+    for n in args.sizes:
+        news = news_items(n)
+        news_models = [NewsItemOut.model_construct(**item) for item in news]
+        project_models = projects(n)
+        match_dicts = matches(n)
+        cases = {
+            # list_news used to build a NewsItemOut per row
+            "news": (lambda: before(news_models), lambda: orjson.dumps(news, option=ORJSON_OPTIONS)),
+            "projects": (
+                lambda: before(project_models),
+                lambda: projects_adapter.dump_json(projects_adapter.validate_python(project_models)),
+            ),
+            "matches": (lambda: before(match_dicts), lambda: orjson.dumps(match_dicts, option=ORJSON_OPTIONS)),
+        }
+        for name, (old, new) in cases.items():
+            assert json.loads(old()) == json.loads(new()), f"{name}: payloads differ"
+            old_ms, new_ms = best_ms(old, args.runs), best_ms(new, args.runs)
+            print(f"{name:<10} {n:>7} {old_ms:>10.2f} {new_ms:>9.2f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Fail when following a keyset-paginated listing does not walk every row
+exactly once.
+
+Starts the app in-process against a throwaway database (seeded on startup),
+turns the response cache off, and for each listing follows X-Next-Cursor
+(or next_cursor for /news) from the first page with a small page size.
+Checks that page 2 differs from page 1, that no row repeats, and that the
+walk returns the same rows in the same order as one large page. Exits 1
+on any mismatch, so it can run in CI on both SQLite and Postgres (their
+datetime storage differs).
+
+Usage (from backend/, DATABASE_URL must be set explicitly):
+    DATABASE_URL=sqlite:////tmp/pages.db ADMIN_TOKEN=x \
+        python -m scripts.check_keyset_pagination
+"""
+import argparse
+import os
+import sys
+
+if "DATABASE_URL" not in os.environ:
+    raise SystemExit("Set DATABASE_URL to a throwaway database; this script seeds it")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.pagination import NEXT_CURSOR_HEADER  # noqa: E402
+from app.core.response_cache import NullBackend, response_cache  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+LISTINGS = [
+    "/api/v1/countries",
+    "/api/v1/projects",
+    "/api/v1/projects?kind=startup",
+    "/api/v1/investors",
+    "/api/v1/news",
+]
+
+FULL_PAGE = 500
+
+
+def _page(client: TestClient, path: str, limit: int, cursor: str | None) -> tuple[list[int], str | None]:
+    params = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    response = client.get(path, params=params)
+    response.raise_for_status()
+    body = response.json()
+    if isinstance(body, dict):  # /news: cursor in the body
+        return [item["id"] for item in body["items"]], body["next_cursor"]
+    return [item["id"] for item in body], response.headers.get(NEXT_CURSOR_HEADER)
+
+
+def check(client: TestClient, path: str, limit: int) -> str | None:
+    expected, _ = _page(client, path, FULL_PAGE, None)
+    pages: list[list[int]] = []
+    cursor = None
+    while True:
+        ids, cursor = _page(client, path, limit, cursor)
+        pages.append(ids)
+        if len(pages) == 2 and pages[0] == pages[1]:
+            return f"page 2 repeats page 1 ({pages[0]})"
+        if not cursor:
+            break
+        if len(pages) > len(expected) + 1:
+            return "cursor never ends"
+    walked = [row_id for ids in pages for row_id in ids]
+    if len(walked) != len(set(walked)):
+        return "rows repeat across pages"
+    if walked != expected:
+        return f"walk returned {len(walked)} rows, one page of {FULL_PAGE} returned {len(expected)}"
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=2, help="page size to walk with")
+    args = parser.parse_args()
+
+    response_cache.backend = NullBackend()
+    failures = []
+    with TestClient(app) as client:
+        for path in LISTINGS:
+            problem = check(client, path, args.limit)
+            print(f"{path:<45} {problem or 'ok'}")
+            if problem:
+                failures.append(f"{path}: {problem}")
+
+    for failure in failures:
+        print(f"\n{failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
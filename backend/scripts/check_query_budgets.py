@@ -0,0 +1,118 @@
+"""
+Fail when a hot endpoint runs more SQL statements or loads more rows than
+its budget.
+
+Starts the app in-process against a throwaway database (seeded on startup,
+plus --news synthetic approved news items so an accidental eager load of
+news shows up), turns the response cache off so every request takes the
+database path, and calls each endpoint under app.db.query_budget. Prints
+the measured counts and exits 1 if any budget is exceeded, so it can run
+in CI after a model or query change.
+
+Budgets are sized for the seed directory. Routes with a statement timeout
+run one extra SET LOCAL statement on Postgres, which the budgets allow for.
+
+Usage (from backend/, DATABASE_URL must be set explicitly):
+    DATABASE_URL=sqlite:////tmp/budget.db ADMIN_TOKEN=x \
+        python -m scripts.check_query_budgets
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+if "DATABASE_URL" not in os.environ:
+    raise SystemExit("Set DATABASE_URL to a throwaway database; this script seeds it")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.response_cache import NullBackend, response_cache  # noqa: E402
+from app.db.query_budget import QueryBudgetExceeded, query_budget  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.country import Country  # noqa: E402
+from app.models.news_item import NewsItem  # noqa: E402
+from app.services.search import FALLBACK_CANDIDATES, SECTIONS, SEARCH_LIMIT  # noqa: E402
+
+
+# Ranked search reads SEARCH_LIMIT hits per section on Postgres; the
+# fallback elsewhere ranks up to FALLBACK_CANDIDATES per section in Python
+SEARCH_ROWS = len(SECTIONS) * (SEARCH_LIMIT if engine.dialect.name == "postgresql" else FALLBACK_CANDIDATES)
+
+
+# path -> (max queries, max rows loaded)
+BUDGETS: dict[str, tuple[int, int]] = {
+    "/api/v1/countries": (2, 10),
+    "/api/v1/countries/1": (7, 30),
+    "/api/v1/countries/ranking": (3, 10),
+    "/api/v1/news?limit=20": (5, 21),
+    "/api/v1/news?country_id=cececo&limit=20": (5, 21),
+    "/api/v1/news?country_id=1&limit=20": (5, 21),
+    "/api/v1/projects": (3, 70),
+    "/api/v1/projects?q=solar": (3, 70),
+    "/api/v1/investors": (4, 25),
+    "/api/v1/investors?country_id=1": (4, 25),
+    "/api/v1/library": (3, 10),
+    "/api/v1/search?q=solar": (5, SEARCH_ROWS),
+    # + zero-score investors (and their countries) when fewer are stored than asked for
+    "/api/v1/projects/1/matches": (5, 70),
+    "/api/v1/projects/matches/bulk": (3, 100),
+    "/api/v1/investors/matches/bulk": (2, 100),
+}
+
+SYNTHETIC_URL = "https://budget.invalid/news/"
+
+
+def seed_news(count: int) -> None:
+    db = SessionLocal()
+    try:
+        existing = db.query(NewsItem).filter(NewsItem.source_url.like(f"{SYNTHETIC_URL}%")).count()
+        country_ids = [cid for (cid,) in db.query(Country.id).all()] + [None]
+        now = datetime.now(timezone.utc)
+        db.add_all(
+            NewsItem(
+                country_id=country_ids[i % len(country_ids)],
+                status="approved",
+                impact_type="policy",
+                impact_score=50,
+                title=f"Synthetic solar headline {i}",
+                summary="Synthetic summary for the query budget check",
+                source_url=f"{SYNTHETIC_URL}{i}",
+                published_at=now - timedelta(hours=i),
+            )
+            for i in range(existing, count)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--news", type=int, default=200, help="synthetic approved news items to ensure")
+    args = parser.parse_args()
+
+    response_cache.backend = NullBackend()
+    failures = []
+    with TestClient(app) as client:
+        seed_news(args.news)
+        print(f"{'endpoint':<45} {'queries':>8} {'rows':>6}  budget")
+        for path, (max_queries, max_rows) in BUDGETS.items():
+            try:
+                with query_budget(max_queries=max_queries, max_rows=max_rows, label=path) as stats:
+                    response = client.get(path)
+                    response.raise_for_status()
+                status = "ok"
+            except QueryBudgetExceeded as e:
+                failures.append(str(e))
+                status = "EXCEEDED"
+            print(f"{path:<45} {stats.queries:>8} {stats.rows:>6}  {max_queries}/{max_rows} {status}")
+
+    for failure in failures:
+        print(f"\n{failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Fail when a response cache backend loses track of tagged entries.
+
+Runs the same cases against MemoryBackend and RedisBackend (on --redis, or
+an in-process fakeredis server when that package is installed): entries
+are evicted by any of their tags, untagged neighbours survive, and a tag
+written by a short-TTL entry after a long-lived one still reaches the
+long-lived entry. Exits 1 on any failure.
+
+Usage (from backend/):
+    python -m scripts.check_response_cache [--redis redis://localhost:6379/15]
+"""
+import argparse
+import sys
+from typing import Callable
+
+from app.core.response_cache import CacheBackend, MemoryBackend, RedisBackend
+
+
+def _check_invalidate_by_tag(backend: CacheBackend) -> str | None:
+    backend.set("a", b"1", 60, ["news", "news:all"])
+    backend.set("b", b"2", 60, ["news", "news:country:1"])
+    backend.set("c", b"3", 60, ["projects", "projects:all"])
+    if backend.invalidate_tags(["news:country:1"]) != 1 or backend.get("b") is not None:
+        return "country tag did not evict its entry"
+    if backend.get("a") != b"1" or backend.get("c") != b"3":
+        return "country tag evicted other entries"
+    backend.invalidate_tags(["news"])
+    if backend.get("a") is not None or backend.get("c") != b"3":
+        return "entity tag did not evict exactly its entries"
+    return None
+
+
+def _check_mixed_ttls(backend: CacheBackend) -> str | None:
+    backend.set("long", b"1", 600, ["news"])
+    backend.set("short", b"2", 5, ["news"])
+    if isinstance(backend, RedisBackend):
+        remaining = backend.client.ttl(backend._tag("news"))
+        if remaining < 590:
+            return f"tag set expires in {remaining}s, before its 600s entry"
+    backend.invalidate_tags(["news"])
+    if backend.get("long") is not None:
+        return "long-lived entry survived invalidation after a shorter TTL on its tag"
+    return None
+
+
+CASES: dict[str, Callable[[CacheBackend], str | None]] = {
+    "invalidate by tag": _check_invalidate_by_tag,
+    "mixed TTLs on one tag": _check_mixed_ttls,
+}
+
+
+def _backends(redis_url: str | None) -> dict[str, Callable[[], CacheBackend]]:
+    backends: dict[str, Callable[[], CacheBackend]] = {"memory": MemoryBackend}
+    if redis_url:
+        import redis
+
+        backends["redis"] = lambda: RedisBackend(redis.Redis.from_url(redis_url), prefix="cececo:check:")
+    else:
+        try:
+            import fakeredis
+        except ImportError:
+            print("fakeredis not installed and no --redis given; skipping RedisBackend")
+        else:
+            backends["fakeredis"] = lambda: RedisBackend(fakeredis.FakeRedis())
+    return backends
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis", help="Redis URL to check against (its cececo:check: keys are cleared)")
+    args = parser.parse_args()
+
+    failures = []
+    for backend_name, make_backend in _backends(args.redis).items():
+        for case_name, case in CASES.items():
+            backend = make_backend()
+            backend.clear()
+            problem = case(backend)
+            backend.clear()
+            print(f"{backend_name:<10} {case_name:<25} {problem or 'ok'}")
+            if problem:
+                failures.append(f"{backend_name}: {case_name}: {problem}")
+
+    for failure in failures:
+        print(f"\n{failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
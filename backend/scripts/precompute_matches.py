@@ -0,0 +1,125 @@
+"""
+Precompute project <-> investor matches for every project and investor.
+
+Scores the whole directory in one vectorized pass (BatchMatcher) and writes
+the top matches per project and per investor as JSON, e.g. from a nightly
+job. --verify re-checks every project against the per-project
+build_matches and fails if any result differs. --write also replaces the
+project_investor_matches table read by GET /projects/{id}/matches.
+
+Usage (from backend/):
+    python -m scripts.precompute_matches --limit 10 --out matches.json
+    python -m scripts.precompute_matches --write --out /dev/null
+"""
+import argparse
+import json
+import sys
+import time
+
+from sqlalchemy.orm import selectinload
+
+import app.main  # noqa: F401 (registers every model for the Country relationships)
+from app.db.session import SessionLocal
+from app.models.investor import Investor
+from app.models.project import Project
+from app.services.batch_matching import BatchMatcher
+from app.services.investor_index import InvestorIndex
+from app.services.match_cache import rebuild_all_matches
+from app.services.matching import build_matches
+
+
+def _summary(entry: dict, key: str) -> dict:
+    return {
+        f"{key}_id": entry[key].id,
+        "score": entry["score"],
+        "score_100": entry["score_100"],
+        "why": entry["why"],
+        "score_breakdown": entry["score_breakdown"],
+    }
+
+
+def _comparable(entries: list[dict]) -> list[tuple]:
+    return [
+        (m["investor"].id, m["score"], m["score_100"], m["reasons"], m["why"], m["reason_points"])
+        for m in entries
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=10, help="Matches kept per project/investor")
+    parser.add_argument("--strict-country", action="store_true")
+    parser.add_argument("--out", help="Write JSON here instead of stdout")
+    parser.add_argument("--verify", action="store_true", help="Compare against build_matches")
+    parser.add_argument("--write", action="store_true", help="Rebuild the project_investor_matches table")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        investors = db.query(Investor).options(selectinload(Investor.countries)).all()
+        projects = db.query(Project).all()
+        loaded = time.perf_counter()
+
+        matcher = BatchMatcher(InvestorIndex(investors))
+        per_project = matcher.top_investors(projects, limit=args.limit, strict_country=args.strict_country)
+        per_investor = matcher.top_projects(projects, limit=args.limit, strict_country=args.strict_country)
+        scored = time.perf_counter()
+
+        print(
+            f"{len(projects)} projects x {len(investors)} investors: "
+            f"load {loaded - started:.2f}s, match {scored - loaded:.2f}s",
+            file=sys.stderr,
+        )
+
+        if args.verify:
+            mismatched = [
+                p.id
+                for p in projects
+                if _comparable(per_project[p.id])
+                != _comparable(
+                    build_matches(p, investors, strict_country=args.strict_country, limit=args.limit)
+                )
+            ]
+            print(
+                f"verify: {len(projects) - len(mismatched)}/{len(projects)} projects identical "
+                f"({time.perf_counter() - scored:.2f}s)",
+                file=sys.stderr,
+            )
+            if mismatched:
+                print(f"verify: mismatched project ids {mismatched[:20]}", file=sys.stderr)
+                sys.exit(1)
+
+        if args.write:
+            written = rebuild_all_matches(db, matcher)
+            print(
+                f"write: {written} rows in project_investor_matches "
+                f"({time.perf_counter() - scored:.2f}s)",
+                file=sys.stderr,
+            )
+
+        payload = {
+            "limit": args.limit,
+            "strict_country": args.strict_country,
+            "projects": {
+                str(pid): [_summary(m, "investor") for m in entries]
+                for pid, entries in per_project.items()
+            },
+            "investors": {
+                str(iid): [_summary(m, "project") for m in entries]
+                for iid, entries in per_investor.items()
+            },
+        }
+    finally:
+        db.close()
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(payload, f)
+    else:
+        json.dump(payload, sys.stdout)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 import { useEffect, useMemo, useState } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
 import InvestorForm from "./InvestorForm";
+import { fetchAllPages } from "./fetchAllPages";
 
 const API_BASE = (
   process.env.API_INTERNAL_BASE ||
@@ -11,15 +12,6 @@ const API_BASE = (
   "https://cececo-hub.vercel.app"
 ).replace(/\/+$/, "");
 
-async function fetchJSON(url) {
-  const res = await fetch(url, { cache: "no-store" });
-  if (!res.ok) {
-    const text = await res.text().catch(() => "");
-    throw new Error(text || `Request failed: ${res.status}`);
-  }
-  return res.json();
-}
-
 function Pill({ children }) {
   return (
     <span className="inline-flex items-center rounded-full border border-slate-200 bg-slate-50 px-2.5 py-1 text-xs font-semibold text-slate-700">
@@ -126,8 +118,8 @@ export default function InvestorsClient({
     setErr("");
     try {
       const [cList, data] = await Promise.all([
-        fetchJSON(`${API_BASE}/api/v1/countries`),
-        fetchJSON(`${API_BASE}/api/v1/investors?${params}`),
+        fetchAllPages(`${API_BASE}/api/v1/countries`),
+        fetchAllPages(`${API_BASE}/api/v1/investors?${params}`),
       ]);
       setCountries(cList);
       setItems(data);
@@ -3,6 +3,7 @@
 import { useEffect, useMemo, useState } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
 import ProjectForm from "./ProjectForm";
+import { fetchAllPages } from "./fetchAllPages";
 
 const API_BASE =
   process.env.NEXT_PUBLIC_API_BASE ||
@@ -104,8 +105,8 @@ export default function ProjectListClient({
     setErr("");
     try {
       const [cList, pList] = await Promise.all([
-        fetchJSON(`${API_BASE}/api/v1/countries`),
-        fetchJSON(`${API_BASE}/api/v1/projects?${apiQuery}`),
+        fetchAllPages(`${API_BASE}/api/v1/countries`),
+        fetchAllPages(`${API_BASE}/api/v1/projects?${apiQuery}`),
       ]);
       setCountries(cList);
       setItems(pList);
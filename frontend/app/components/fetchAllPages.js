@@ -0,0 +1,23 @@
+// Directory listings (/countries, /projects, /investors) are keyset-paginated:
+// each response is one page (a JSON array) and the X-Next-Cursor header, absent
+// on the last page, is the `cursor` of the next one. /news is paginated too,
+// but carries next_cursor in its JSON body.
+export const PAGE_SIZE = 500; // the API's maximum `limit`
+
+export async function fetchAllPages(url, init = { cache: "no-store" }) {
+  const items = [];
+  let cursor = null;
+  do {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+    if (cursor) params.set("cursor", cursor);
+    const sep = url.includes("?") ? "&" : "?";
+    const res = await fetch(`${url}${sep}${params.toString()}`, init);
+    if (!res.ok) {
+      const text = await res.text().catch(() => "");
+      throw new Error(text || `Request failed: ${res.status}`);
+    }
+    items.push(...(await res.json()));
+    cursor = res.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return items;
+}
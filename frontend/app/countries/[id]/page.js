@@ -1,4 +1,5 @@
 import Link from "next/link";
+import { fetchAllPages } from "../../components/fetchAllPages";
 
 const API_BASE =
   process.env.API_INTERNAL_BASE ||
@@ -93,11 +94,7 @@ async function getCountry(id) {
 }
 
 async function getCountries() {
-  const res = await fetch(`${API_BASE}/api/v1/countries`, {
-    cache: "no-store",
-  });
-  if (!res.ok) throw new Error("Failed to fetch countries");
-  return res.json();
+  return fetchAllPages(`${API_BASE}/api/v1/countries`);
 }
 
 async function getNews(countryId) {
@@ -116,11 +113,7 @@ async function getProjects(countryId, kind) {
   const params = new URLSearchParams();
   params.set("country_id", String(countryId));
   params.set("kind", String(kind));
-  const res = await fetch(`${API_BASE}/api/v1/projects?${params.toString()}`, {
-    cache: "no-store",
-  });
-  if (!res.ok) throw new Error("Failed to fetch projects");
-  return res.json();
+  return fetchAllPages(`${API_BASE}/api/v1/projects?${params.toString()}`);
 }
 
 /* ----------------------------- derived: focus & signals ----------------------------- */
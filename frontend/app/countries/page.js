@@ -1,4 +1,5 @@
 import Link from "next/link";
+import { fetchAllPages } from "../components/fetchAllPages";
 
 const API_BASE =
   process.env.API_INTERNAL_BASE ||
@@ -8,11 +9,7 @@ const API_BASE =
   "https://cececo-hub.vercel.app";
 
 async function getCountries() {
-  const res = await fetch(`${API_BASE}/api/v1/countries`, {
-    cache: "no-store",
-  });
-  if (!res.ok) throw new Error("Failed to fetch countries");
-  return res.json();
+  return fetchAllPages(`${API_BASE}/api/v1/countries`);
 }
 
 async function getRanking() {
@@ -1,5 +1,6 @@
 import NewsFiltersClient from "../components/NewsFiltersClient";
 import NewsListWithLoading from "../components/NewsListWithLoading";
+import { fetchAllPages } from "../components/fetchAllPages";
 
 const API_BASE =
   process.env.API_INTERNAL_BASE ||
@@ -9,11 +10,7 @@ const API_BASE =
   "https://cececo-hub.vercel.app";
 
 async function getCountries() {
-  const res = await fetch(`${API_BASE}/api/v1/countries`, {
-    cache: "no-store",
-  });
-  if (!res.ok) throw new Error("Failed to fetch countries");
-  return res.json();
+  return fetchAllPages(`${API_BASE}/api/v1/countries`);
 }
 
 async function getNews({ countryId, q }) {